@@ -6,12 +6,20 @@ PyQt版本
 @license: GPL-3.0
 """
 
+import os
 import sys
 import json
+import math
+import time
+import uuid
 import ctypes
+import importlib.util
 import urllib.parse
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+from string import Template
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from typing import Dict, Optional, Any
 
 from loguru import logger
@@ -19,30 +27,77 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QSystemTrayIcon, QMenu,
     QListWidget, QListWidgetItem, QProgressBar, QTextEdit, QGridLayout,
-    QSlider, QCheckBox, QDialog, QFileDialog, QLineEdit, QComboBox, QSpinBox
+    QSlider, QCheckBox, QDialog, QFileDialog, QLineEdit, QComboBox, QSpinBox, QMessageBox
 )
 from PyQt6.QtCore import (
     Qt, QTimer, QRect, QPoint, QPointF, QPropertyAnimation, QEasingCurve, pyqtSignal, pyqtProperty,
-    QByteArray
+    QByteArray, QObject, QRunnable, QThreadPool, QRectF, QSize, QLine, QUrl, QVariantAnimation
+)
+from PyQt6.QtGui import (
+    QColor, QPainter, QBrush, QPen, QScreen, QPixmap, QFont, QIcon, QPolygonF, QPixmapCache, QPainterPath,
+    QImage, QFontMetrics, QFontDatabase
 )
-from PyQt6.QtGui import QColor, QPainter, QBrush, QPen, QScreen, QPixmap, QFont, QIcon, QPolygonF
 from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
-# 网页组件支持（可选）
+# 网页组件支持（可选）：启动时只探测模块是否存在，首次创建网页组件时才真正导入
 try:
-    from PyQt6.QtWebEngineWidgets import QWebEngineView
-    WEBENGINE_AVAILABLE = True
-except ImportError as e:
-    print(f"WebEngine 导入失败: {e}")
-    QWebEngineView = None
-    WEBENGINE_AVAILABLE = False
-except Exception as e:
-    print(f"WebEngine 初始化错误: {e}")
-    QWebEngineView = None
+    WEBENGINE_AVAILABLE = importlib.util.find_spec("PyQt6.QtWebEngineWidgets") is not None
+except (ImportError, ValueError):
     WEBENGINE_AVAILABLE = False
+QWebEngineView = None
+
+
+def _ensure_webengine() -> bool:
+    """按需导入 QtWebEngine（导入较慢且占用大量内存，不放在启动路径上）"""
+    global QWebEngineView, WEBENGINE_AVAILABLE
+    if QWebEngineView is None and WEBENGINE_AVAILABLE:
+        try:
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+        except Exception as e:
+            logger.error(f"WebEngine 导入失败: {e}")
+            WEBENGINE_AVAILABLE = False
+    return QWebEngineView is not None
+
+# 媒体会话支持（可选）
+try:
+    import comtypes
+    from pycaw.pycaw import AudioUtilities
+    PYCAW_AVAILABLE = True
+except ImportError as e:
+    print(f"pycaw 导入失败: {e}")
+    comtypes = None
+    AudioUtilities = None
+    PYCAW_AVAILABLE = False
+
+# 更快的 JSON 序列化（可选）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 图片滤镜向量化计算（可选）
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 滤镜内核 JIT 编译（可选，需同时安装 numpy）
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Windows 专用模块（其他平台下为 None）
+try:
+    import winsound
+    import winreg
+except ImportError:
+    winsound = None
+    winreg = None
 
 import psutil
-import ctypes
+from ctypes import wintypes
 
 # Windows API 常量
 GWL_EXSTYLE = -20
@@ -52,10 +107,113 @@ WS_EX_LAYERED = 0x00080000
 # Windows API 函数
 user32 = ctypes.windll.user32
 
+# 常用函数在加载时绑定一次，并声明参数类型，省去每次调用的属性查找和参数推断
+_SetWindowPos = user32.SetWindowPos
+_SetWindowPos.argtypes = [
+    wintypes.HWND, wintypes.HWND,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint
+]
+_SetWindowPos.restype = wintypes.BOOL
+
+_GetWindowLongW = user32.GetWindowLongW
+_GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+_GetWindowLongW.restype = wintypes.LONG
+
+_SetWindowLongW = user32.SetWindowLongW
+_SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+_SetWindowLongW.restype = wintypes.LONG
+
+_FlashWindow = user32.FlashWindow
+_FlashWindow.argtypes = [wintypes.HWND, wintypes.BOOL]
+_FlashWindow.restype = wintypes.BOOL
+
+_RegisterHotKey = user32.RegisterHotKey
+_RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+_RegisterHotKey.restype = wintypes.BOOL
+
+_UnregisterHotKey = user32.UnregisterHotKey
+_UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+_UnregisterHotKey.restype = wintypes.BOOL
+
+# 全局热键
+WM_HOTKEY = 0x0312
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+
+# 键盘输入（SendInput 一次调用提交按下和释放两个事件）
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+VK_MEDIA_NEXT_TRACK = 0xB0
+VK_MEDIA_PREV_TRACK = 0xB1
+VK_MEDIA_PLAY_PAUSE = 0xB3
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD)]
+
+
+class _INPUT(ctypes.Structure):
+    # 联合体需包含全部成员，保证 sizeof(INPUT) 与系统一致
+    class _U(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _U)]
+
+
+_SendInput = user32.SendInput
+_SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+_SendInput.restype = wintypes.UINT
+
+
+def _make_key_tap(vk):
+    """构造按下+释放的 INPUT 数组"""
+    inputs = (_INPUT * 2)()
+    for item, flags in zip(inputs, (KEYEVENTF_EXTENDEDKEY, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP)):
+        item.type = INPUT_KEYBOARD
+        item.ki.wVk = vk
+        item.ki.dwFlags = flags
+    return inputs
+
+
+# 媒体键只有这三个，预先构造好输入数组
+_MEDIA_KEY_INPUTS = {
+    vk: _make_key_tap(vk)
+    for vk in (VK_MEDIA_PLAY_PAUSE, VK_MEDIA_PREV_TRACK, VK_MEDIA_NEXT_TRACK)
+}
+
+# 批量窗口位置调整（句柄为指针宽度，需显式声明类型避免64位截断）
+user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+user32.DeferWindowPos.argtypes = [
+    wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint
+]
+user32.DeferWindowPos.restype = wintypes.HANDLE
+user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+user32.EndDeferWindowPos.restype = wintypes.BOOL
+
 # 配置目录
 DATA_DIR = Path.home() / ".dashwidgets_pyqt"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 CONFIG_FILE = DATA_DIR / "config.json"
+WEATHER_CACHE_FILE = DATA_DIR / "weather_cache.json"
+WEATHER_CACHE_TTL = 600  # 天气缓存有效期（秒）
 LOG_DIR = DATA_DIR / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -63,6 +221,11 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 ASSETS_DIR = Path(__file__).parent / "assets"
 ICONS_DIR = ASSETS_DIR / "icons"
 IMAGES_DIR = ASSETS_DIR / "images"
+STYLES_DIR = ASSETS_DIR / "styles"
+
+# 开机自启动注册表项
+AUTOSTART_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+AUTOSTART_NAME = "DashWidgets"
 
 # 配置日志
 logger.add(
@@ -97,10 +260,16 @@ class ThemeColors:
             "accent": "#00B7C3", "accent_hover": "#00909A", "accent_pressed": "#006D73", "accent_light": "#66D9E0"
         }
     }
+    # 设置页下拉框中配色方案的顺序、显示名称及反查索引
+    SCHEME_NAMES = ("blue", "green", "purple", "orange", "red", "teal")
+    SCHEME_LABELS = ("蓝色", "绿色", "紫色", "橙色", "红色", "青色")
+    SCHEME_INDEX = {name: i for i, name in enumerate(SCHEME_NAMES)}
 
     def __init__(self, light_mode: bool = True, color_scheme: str = "blue"):
         self.light_mode = light_mode
         self.color_scheme = color_scheme
+        self.version = 0  # 每次颜色更新递增
+        self._qss_cache: Dict[tuple, str] = {}
         self._update_colors()
 
     def _update_colors(self):
@@ -151,9 +320,85 @@ class ThemeColors:
             self.error = "#FF99A4"             # 错误
             self.shadow = QColor(0, 0, 0, 40)
 
+        self.version += 1
+        self._qss_cache.clear()
+
+    def qss(self, template, **extra) -> str:
+        """用当前主题颜色格式化样式表模板（同一主题下结果缓存）
+
+        template 可以是 str.format 风格的字符串，也可以是从 .qss 文件读取的 $占位符 Template
+        """
+        key = (template, tuple(extra.items()))
+        style = self._qss_cache.get(key)
+        if style is None:
+            values = {**self.__dict__, **extra} if extra else self.__dict__
+            if isinstance(template, Template):
+                style = template.substitute(values)
+            else:
+                style = template.format_map(values)
+            self._qss_cache[key] = style
+        return style
+
+
+# 界面字体候选（按优先级），启动时从已安装字体中选出第一个
+UI_FONT_FAMILIES = ("Segoe UI", "Microsoft YaHei UI", "Noto Sans CJK SC", "DejaVu Sans")
+ui_font_family = UI_FONT_FAMILIES[0]
+
+
+# 小组件右键菜单样式模板
+MENU_QSS = """
+    QMenu {{
+        background-color: {bg_card};
+        border: 1px solid {border};
+        border-radius: 8px;
+        padding: 6px 4px;
+        font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
+        font-size: 13px;
+    }}
+    QMenu::item {{
+        padding: 8px 28px 8px 16px;
+        border-radius: 4px;
+        background: transparent;
+        color: {text_primary};
+        margin: 1px 4px;
+    }}
+    QMenu::item:selected {{
+        background-color: {bg_hover};
+    }}
+    QMenu::item:pressed {{
+        background-color: {bg_pressed};
+    }}
+    QMenu::separator {{
+        height: 1px;
+        background-color: {border};
+        margin: 4px 12px;
+    }}
+    QMenu::indicator {{
+        width: 16px;
+        height: 16px;
+        margin-left: 8px;
+    }}
+    QMenu::indicator:checked {{
+        background-color: {accent};
+        border: none;
+        border-radius: 3px;
+    }}
+    QMenu::indicator:unchecked {{
+        background-color: transparent;
+        border: 2px solid {text_tertiary};
+        border-radius: 3px;
+    }}
+"""
+
+
+# 管理器窗口样式模板（assets/styles/manager.qss，启动时读取一次）
+MANAGER_QSS = Template((STYLES_DIR / "manager.qss").read_text(encoding="utf-8"))
+
 
-# 全局主题
-theme = ThemeColors(light_mode=True)
+def apply_style_sheet(widget: QWidget, style: str):
+    """设置样式表，内容未变化时跳过，避免 Qt 重新解析和重算样式"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
 
 
 class WidgetConfig:
@@ -165,38 +410,306 @@ class WidgetConfig:
         self.snap_enabled: bool = True
         self.snap_threshold: int = 20
         self.color_scheme: str = "blue"
+        self._save_timer: Optional[QTimer] = None
+        # 上次写入配置文件的内容，内容没变时 save() 不再写盘
+        self._saved_payload: Optional[bytes] = None
         self.load()
 
+    @property
+    def widgets(self) -> list:
+        return self._widgets
+
+    @widgets.setter
+    def widgets(self, value: list):
+        self._widgets = value
+        # id → 配置项索引，避免每次查找都线性扫描
+        self._by_id: Dict[str, dict] = {w.get("id"): w for w in value}
+
+    def get_widget(self, widget_id: str) -> Optional[dict]:
+        """按 id 获取小组件配置"""
+        return self._by_id.get(widget_id)
+
+    def add_widget(self, widget_config: dict):
+        """添加小组件配置"""
+        self._widgets.append(widget_config)
+        self._by_id[widget_config.get("id")] = widget_config
+
+    def remove_widget(self, widget_id: str):
+        """移除小组件配置"""
+        widget_config = self._by_id.pop(widget_id, None)
+        if widget_config is not None:
+            self._widgets.remove(widget_config)
+
+    @staticmethod
+    def read_file(path: Path) -> dict:
+        """读取并解析配置文件（有 orjson 时用 orjson 解析）"""
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("配置文件格式无效")
+        return data
+
+    def load_from_dict(self, data: dict):
+        """从字典应用配置"""
+        self.widgets = data.get("widgets", [])
+        self.light_mode = data.get("light_mode", True)
+        self.widget_opacity = data.get("widget_opacity", 0.95)
+        self.snap_enabled = data.get("snap_enabled", True)
+        self.snap_threshold = data.get("snap_threshold", 20)
+        self.color_scheme = data.get("color_scheme", "blue")
+
+    def to_dict(self) -> dict:
+        """导出为可序列化的字典"""
+        return {
+            "widgets": self.widgets,
+            "light_mode": self.light_mode,
+            "widget_opacity": self.widget_opacity,
+            "snap_enabled": self.snap_enabled,
+            "snap_threshold": self.snap_threshold,
+            "color_scheme": self.color_scheme
+        }
+
+    def _serialize(self) -> bytes:
+        if orjson is not None:
+            # orjson 直接输出 UTF-8 字节，省去 str 中转和再编码
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+
+    def write_to(self, path: Path, payload: Optional[bytes] = None):
+        """写入配置文件（先写临时文件再替换，避免写到一半的文件被读取）"""
+        if payload is None:
+            payload = self._serialize()
+        tmp_file = path.with_name(path.name + ".tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, path)
+
     def load(self):
         if CONFIG_FILE.exists():
             try:
-                data = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-                self.widgets = data.get("widgets", [])
-                self.light_mode = data.get("light_mode", True)
-                self.widget_opacity = data.get("widget_opacity", 0.95)
-                self.snap_enabled = data.get("snap_enabled", True)
-                self.snap_threshold = data.get("snap_threshold", 20)
-                self.color_scheme = data.get("color_scheme", "blue")
+                self.load_from_dict(self.read_file(CONFIG_FILE))
             except Exception as e:
                 logger.error(f"加载配置失败: {e}")
 
     def save(self):
         try:
-            data = {
-                "widgets": self.widgets,
-                "light_mode": self.light_mode,
-                "widget_opacity": self.widget_opacity,
-                "snap_enabled": self.snap_enabled,
-                "snap_threshold": self.snap_threshold,
-                "color_scheme": self.color_scheme
-            }
-            CONFIG_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            payload = self._serialize()
+            if payload == self._saved_payload:
+                return
+            self.write_to(CONFIG_FILE, payload)
+            self._saved_payload = payload
         except Exception as e:
             logger.error(f"保存配置失败: {e}")
 
+    def save_later(self, delay: int = 500):
+        """延迟保存，合并短时间内的多次修改"""
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self.save)
+        self._save_timer.start(delay)
+
+    def flush(self):
+        """立即写入尚未保存的延迟修改"""
+        if self._save_timer is not None and self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save()
+
 
 config = WidgetConfig()
 
+# 全局主题：按已保存的配置只创建一次，之后切换主题时原地更新颜色
+theme = ThemeColors(light_mode=config.light_mode, color_scheme=config.color_scheme)
+
+
+class _TaskSignals(QObject):
+    """后台任务信号（跨线程回到主线程）"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class BackgroundTask(QRunnable):
+    """在全局线程池中执行阻塞调用，结果通过信号回到主线程"""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+_tick_timer = None
+
+
+def tick_bus() -> QTimer:
+    """全局 1 秒节拍定时器（首次使用时创建），所有小组件共享同一个定时器"""
+    global _tick_timer
+    if _tick_timer is None:
+        _tick_timer = QTimer()
+        _tick_timer.start(1000)
+    return _tick_timer
+
+
+# 滤镜定点系数（模块加载时算好，各实现共用）
+# 灰度 Q8：(b, g, r) 权重 ≈ (0.114, 0.587, 0.299) * 256，和为 256，白色仍为 255
+GRAY_Q8 = (29, 150, 77)
+# 复古 Q7：按输出 B、G、R 排列，每行为 (r, g, b) 权重；行和不超过 172，16 位累加不会溢出
+SEPIA_Q7 = (
+    (35, 68, 17),   # 0.272, 0.534, 0.131
+    (45, 88, 22),   # 0.349, 0.686, 0.168
+    (50, 98, 24),   # 0.393, 0.769, 0.189
+)
+
+# numba 编译的单遍滤镜内核：逐像素整数运算，不产生临时数组
+FILTER_KERNELS = {}
+if njit is not None and np is not None:
+    # 打包后的程序没有可写的源码目录，不使用磁盘缓存
+    @njit(cache=not getattr(sys, "frozen", False), fastmath=True)
+    def _grayscale_kernel(arr):
+        wb, wg, wr = GRAY_Q8
+        for i in range(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                gray = (arr[i, j, 0] * wb + arr[i, j, 1] * wg + arr[i, j, 2] * wr) >> 8
+                arr[i, j, 0] = gray
+                arr[i, j, 1] = gray
+                arr[i, j, 2] = gray
+
+    @njit(cache=not getattr(sys, "frozen", False), fastmath=True)
+    def _sepia_kernel(arr):
+        (br, bg, bb), (gr, gg, gb), (rr, rg, rb) = SEPIA_Q7
+        for i in range(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                b = arr[i, j, 0]
+                g = arr[i, j, 1]
+                r = arr[i, j, 2]
+                arr[i, j, 0] = min(255, (br * r + bg * g + bb * b) >> 7)
+                arr[i, j, 1] = min(255, (gr * r + gg * g + gb * b) >> 7)
+                arr[i, j, 2] = min(255, (rr * r + rg * g + rb * b) >> 7)
+
+    FILTER_KERNELS = {"grayscale": _grayscale_kernel, "sepia": _sepia_kernel}
+
+
+def apply_image_filter(image: QImage, filter_type: str) -> QImage:
+    """对图片应用滤镜（仅使用 QImage，可在后台线程调用）"""
+    if filter_type == "invert":
+        # Qt 内部按字异或取反并保留 alpha，无需先转换格式
+        image.invertPixels()
+        return image
+
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+
+    w, h = image.width(), image.height()
+    if np is not None:
+        # ARGB32 在内存中按 B, G, R, A 排列，直接在图片缓冲区上原地修改，不再额外复制
+        ptr = image.bits()
+        ptr.setsize(image.sizeInBytes())
+        arr = np.frombuffer(ptr, dtype=np.uint8).reshape(h, image.bytesPerLine())[:, :w * 4].reshape(h, w, 4)
+        kernel = FILTER_KERNELS.get(filter_type)
+        if kernel is not None:
+            kernel(arr)
+        elif filter_type == "grayscale":
+            # Q8 定点权重，全程整数运算；先扩成 16 位，否则 NumPy 1.x 下 uint8 乘积会溢出回绕
+            bgr = arr[..., :3].astype(np.uint16)
+            gray = (bgr[..., 0] * GRAY_Q8[0] + bgr[..., 1] * GRAY_Q8[1] + bgr[..., 2] * GRAY_Q8[2]) >> 8
+            arr[..., :3] = gray.astype(np.uint8)[..., None]
+        elif filter_type == "sepia":
+            # 16 位整数通道 + Q7 定点权重，饱和截断用一次 minimum 完成，无分支也不产生浮点临时数组
+            b, g, r = (arr[..., c].astype(np.uint16) for c in range(3))
+            acc = np.empty_like(b)
+            term = np.empty_like(b)
+            for c, (wr, wg, wb) in enumerate(SEPIA_Q7):
+                np.multiply(r, wr, out=acc)
+                acc += np.multiply(g, wg, out=term)
+                acc += np.multiply(b, wb, out=term)
+                acc >>= 7
+                np.minimum(acc, 255, out=acc)
+                arr[..., c] = acc
+        return image
+
+    # 没有 numpy 时逐像素处理
+    for y in range(h):
+        for x in range(w):
+            color = image.pixelColor(x, y)
+            r, g, b = color.red(), color.green(), color.blue()
+
+            if filter_type == "grayscale":
+                gray = (b * GRAY_Q8[0] + g * GRAY_Q8[1] + r * GRAY_Q8[2]) >> 8
+                color = QColor(gray, gray, gray, color.alpha())
+            elif filter_type == "sepia":
+                nb, ng, nr = (min(255, (wr * r + wg * g + wb * b) >> 7) for wr, wg, wb in SEPIA_Q7)
+                color = QColor(nr, ng, nb, color.alpha())
+
+            image.setPixelColor(x, y, color)
+    return image
+
+
+class WidgetOpacity(QObject):
+    """小组件背景透明度通知：数值只存在 config 中，变化时由各小组件自行重绘"""
+    changed = pyqtSignal()
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "WidgetOpacity":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+class NetSampler(QObject):
+    """全局网络流量采样器：每个节拍读取一次计数，把增量分发给所有订阅者"""
+    sampled = pyqtSignal('qint64', 'qint64')  # (下载字节数, 上传字节数)，用 64 位避免大增量溢出
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "NetSampler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._last = psutil.net_io_counters()
+        tick_bus().timeout.connect(self._sample)
+
+    def _sample(self):
+        # 没有订阅者时不读取，恢复订阅后重新建立基准
+        if self.receivers(self.sampled) == 0:
+            self._last = None
+            return
+        net = psutil.net_io_counters()
+        last = self._last
+        self._last = net
+        if last is not None:
+            self.sampled.emit(net.bytes_recv - last.bytes_recv, net.bytes_sent - last.bytes_sent)
+
+
+_mmss_texts = None
+
+
+def format_hms(seconds: int) -> str:
+    """秒数格式化为 HH:MM:SS（一小时以内直接查表）"""
+    global _mmss_texts
+    if seconds < 3600:
+        if _mmss_texts is None:
+            _mmss_texts = [f"00:{m:02d}:{s:02d}" for m in range(60) for s in range(60)]
+        return _mmss_texts[seconds]
+    minutes_total, s = divmod(seconds, 60)
+    h, m = divmod(minutes_total, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def center_crop_rect(img_w: int, img_h: int, target_ratio: float) -> QRect:
+    """按目标宽高比计算居中的最大裁剪区域（一边取满，另一边按比例截取）"""
+    crop_w = min(img_w, int(img_h * target_ratio))
+    crop_h = min(img_h, int(img_w / target_ratio))
+    return QRect((img_w - crop_w) // 2, (img_h - crop_h) // 2, crop_w, crop_h)
+
 
 class AnimatedNavButton(QPushButton):
     """带动画效果的导航按钮"""
@@ -233,16 +746,21 @@ class AnimatedNavButton(QPushButton):
 
     def _load_icon(self, icon_path: str):
         """加载并着色图标"""
-        from PyQt6.QtGui import QPixmap, QIcon
+        # 获取当前主题的文字颜色
+        icon_color = theme.text_primary
+
+        # 优先从全局像素图缓存读取（主题来回切换时无需重新渲染SVG）
+        cache_key = f"icon:{icon_path}:{icon_color}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            self._icon_pixmap = cached
+            return
 
         # 读取SVG文件并替换currentColor为实际颜色
         try:
             with open(icon_path, 'r', encoding='utf-8') as f:
                 svg_content = f.read()
 
-            # 获取当前主题的文字颜色
-            icon_color = theme.text_primary
-
             # 替换currentColor为实际颜色
             svg_content = svg_content.replace('currentColor', icon_color)
 
@@ -259,6 +777,7 @@ class AnimatedNavButton(QPushButton):
                 renderer.render(painter)
                 painter.end()
                 self._icon_pixmap = pixmap
+                QPixmapCache.insert(cache_key, pixmap)
                 return
         except Exception as e:
             logger.warning(f"加载SVG图标失败: {e}")
@@ -266,6 +785,7 @@ class AnimatedNavButton(QPushButton):
         # 回退到普通加载方式
         icon = QIcon(str(icon_path))
         self._icon_pixmap = icon.pixmap(20, 20)
+        QPixmapCache.insert(cache_key, self._icon_pixmap)
 
     @pyqtProperty(float)
     def hover_progress(self):
@@ -273,6 +793,9 @@ class AnimatedNavButton(QPushButton):
 
     @hover_progress.setter
     def hover_progress(self, value):
+        # 忽略肉眼不可见的微小变化，但保证动画终点一定会被绘制
+        if abs(value - self._hover_progress) < 0.02 and value not in (0.0, 1.0):
+            return
         self._hover_progress = value
         self.update()
 
@@ -283,7 +806,8 @@ class AnimatedNavButton(QPushButton):
     @indicator_width.setter
     def indicator_width(self, value):
         self._indicator_width = value
-        self.update()
+        # 只重绘左侧指示器区域（最大宽度3px，额外1px留给抗锯齿）
+        self.update(0, 0, 4, self.height())
 
     @property
     def active(self):
@@ -293,6 +817,8 @@ class AnimatedNavButton(QPushButton):
     def active(self, value: bool):
         if self._active != value:
             self._active = value
+            # 文字颜色和字重随选中状态变化，整体重绘一次；动画帧只重绘指示器
+            self.update()
             # 指示器动画
             self._indicator_anim.stop()
             self._indicator_anim.setStartValue(self._indicator_width)
@@ -362,6 +888,70 @@ class AnimatedNavButton(QPushButton):
         self.update()
 
 
+class CloseButton(QPushButton):
+    """小组件关闭按钮 - 使用缓存的叉号图标代替文字，免去每次绘制的文字排版"""
+    ICON_SIZE = 8
+
+    QSS = """
+            QPushButton {{
+                background: transparent;
+                border: none;
+                border-radius: 10px;
+            }}
+            QPushButton:hover {{
+                background: {error};
+            }}
+        """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hovered = False
+        self.setFixedSize(20, 20)
+        self.setIconSize(QSize(self.ICON_SIZE, self.ICON_SIZE))
+        self.update_style()
+
+    @classmethod
+    def _cross_pixmap(cls, color: str) -> QPixmap:
+        """获取指定颜色的叉号图标（通过 QPixmapCache 缓存）"""
+        cache_key = f"close:{color}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        # 2倍尺寸绘制，确保高DPI下清晰
+        size = cls.ICON_SIZE * 2
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(color), 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        painter.drawLine(2, 2, size - 2, size - 2)
+        painter.drawLine(size - 2, 2, 2, size - 2)
+        painter.end()
+
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
+    def _update_icon(self):
+        color = "white" if self._hovered else theme.text_secondary
+        self.setIcon(QIcon(self._cross_pixmap(color)))
+
+    def update_style(self):
+        """更新样式（切换主题时调用）"""
+        apply_style_sheet(self, theme.qss(self.QSS))
+        self._update_icon()
+
+    def enterEvent(self, event):
+        super().enterEvent(event)
+        self._hovered = True
+        self._update_icon()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._hovered = False
+        self._update_icon()
+
+
 class BaseWidget(QFrame):
     """小组件基类"""
     closed = pyqtSignal(str)
@@ -376,20 +966,36 @@ class BaseWidget(QFrame):
 
     # 阴影边距
     SHADOW_MARGIN = 10
+
+    TITLE_QSS = """
+            color: {text_secondary};
+            font-size: 12px;
+            font-weight: 500;
+        """
     # 所有小组件实例
     _all_widgets: list = []
+    # 批量恢复期间推迟 SetWindowPos，由 apply_top_state_bulk 统一提交
+    _defer_top_state = False
+    # 隐藏时 update_content 是否仍按节拍运行（默认暂停）
+    TICK_WHEN_HIDDEN = False
 
     def __init__(self, widget_id: str, name: str, size: str = "medium", parent=None):
         super().__init__(parent)
         self.widget_id = widget_id
         self.widget_name = name
         self.size_key = size
-        self.opacity = config.widget_opacity
         self.drag_pos = None
         self._snap_indicator_rect = None
         self._snap_indicator_type = None  # 'left', 'right', 'top', 'bottom'
         self.click_through = False  # 鼠标穿透模式
         self.always_on_top = False  # 默认不置顶，只显示在桌面
+        self._ctx_menu = None  # 右键菜单（首次打开时创建并复用）
+        self._tick_slots = []  # 已订阅全局节拍的回调 (slot, 隐藏时是否暂停)
+        self._timers = []  # 组件自有定时器，隐藏时暂停
+        self._stopped_timers = []  # 因隐藏而停止、显示时需恢复的定时器
+        self._updates_paused = False
+        self._style_version = theme.version  # 当前样式对应的主题版本
+        self._hwnd = None  # 原生窗口句柄缓存，窗口标志变化后失效
 
         # 拖拽调整大小相关
         self._resizing = False
@@ -397,6 +1003,9 @@ class BaseWidget(QFrame):
         self._resize_start_size = None
         self._resize_handle_size = 16  # 调整大小手柄区域大小
 
+        # 内容区域圆角路径（尺寸变化时重建）
+        self._content_path = None
+
         # 添加到全局列表
         BaseWidget._all_widgets.append(self)
 
@@ -407,13 +1016,17 @@ class BaseWidget(QFrame):
         # 加载置顶配置
         self._load_top_state()
 
-        # 定时器
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_content)
-        self.update_timer.start(1000)
+        # 每秒刷新（订阅全局节拍，不再每个组件单独建定时器）
+        self._subscribe_tick(self.update_content, not self.TICK_WHEN_HIDDEN)
+        # 透明度统一存于 config，变化时只需重绘
+        WidgetOpacity.instance().changed.connect(self.update)
 
         self.update_content()
 
+    @property
+    def opacity(self) -> float:
+        return config.widget_opacity
+
     def _init_window(self):
         """初始化窗口属性"""
         w, h = self.SIZE_MAP.get(self.size_key, (220, 220))
@@ -432,50 +1045,90 @@ class BaseWidget(QFrame):
 
     def _load_top_state(self):
         """加载置顶状态配置"""
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                self.always_on_top = widget_config.get("always_on_top", False)
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            self.always_on_top = widget_config.get("always_on_top", False)
 
         # 应用置顶状态
         self._apply_top_state()
 
     def _apply_top_state(self):
         """应用置顶状态"""
-        if self.always_on_top:
-            # 设置置顶窗口标志
-            self.setWindowFlags(
-                Qt.WindowType.FramelessWindowHint |
-                Qt.WindowType.WindowStaysOnTopHint |
-                Qt.WindowType.Tool
-            )
-        else:
-            # 普通窗口标志
-            self.setWindowFlags(
-                Qt.WindowType.FramelessWindowHint |
-                Qt.WindowType.Tool
-            )
-        self.show()
+        self._set_window_layer(self.always_on_top, sync_native=not BaseWidget._defer_top_state)
 
-        hwnd = int(self.winId())
-        SWP_NOSIZE = 0x0001
-        SWP_NOMOVE = 0x0002
+    def _set_window_layer(self, on_top: bool, sync_native: bool = True):
+        """切换置顶窗口标志并同步到 Windows 窗口层级"""
+        flags = Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool
+        if on_top:
+            flags |= Qt.WindowType.WindowStaysOnTopHint
+
+        # 合并整个切换过程的重绘
+        self.setUpdatesEnabled(False)
+        try:
+            # 仅在标志实际变化时才让 Qt 重建原生窗口
+            if self.windowFlags() != flags:
+                self.setWindowFlags(flags)
+                # 重设标志会重建原生窗口，句柄随之改变
+                self._hwnd = None
+            if not self.isVisible():
+                self.show()
+
+            if not sync_native:
+                return
 
-        if self.always_on_top:
             HWND_TOPMOST = -1
-            ctypes.windll.user32.SetWindowPos(
-                hwnd, HWND_TOPMOST,
+            HWND_NOTOPMOST = -2
+            SWP_NOSIZE = 0x0001
+            SWP_NOMOVE = 0x0002
+            SWP_NOACTIVATE = 0x0010
+            SWP_NOSENDCHANGING = 0x0400
+
+            _SetWindowPos(
+                self._get_hwnd(), HWND_TOPMOST if on_top else HWND_NOTOPMOST,
                 0, 0, 0, 0,
-                SWP_NOSIZE | SWP_NOMOVE
+                SWP_NOSIZE | SWP_NOMOVE | SWP_NOACTIVATE | SWP_NOSENDCHANGING
             )
-        else:
-            HWND_NOTOPMOST = -2
-            ctypes.windll.user32.SetWindowPos(
-                hwnd, HWND_NOTOPMOST,
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _get_hwnd(self) -> int:
+        """获取原生窗口句柄（首次访问时缓存）"""
+        if self._hwnd is None:
+            self._hwnd = int(self.winId())
+        return self._hwnd
+
+    @classmethod
+    def apply_top_state_bulk(cls, widgets):
+        """批量应用置顶状态 - 通过 DeferWindowPos 一次性提交所有窗口的层级调整"""
+        widgets = [w for w in widgets if w.isVisible()]
+        if not widgets:
+            return
+
+        HWND_TOPMOST = -1
+        HWND_NOTOPMOST = -2
+        SWP_NOSIZE = 0x0001
+        SWP_NOMOVE = 0x0002
+
+        hdwp = user32.BeginDeferWindowPos(len(widgets))
+        for widget in widgets:
+            if not hdwp:
+                break
+            hdwp = user32.DeferWindowPos(
+                hdwp, widget._get_hwnd(),
+                HWND_TOPMOST if widget.always_on_top else HWND_NOTOPMOST,
                 0, 0, 0, 0,
                 SWP_NOSIZE | SWP_NOMOVE
             )
 
+        if hdwp:
+            user32.EndDeferWindowPos(hdwp)
+            return
+
+        # 批量提交失败时逐个回退
+        logger.warning("批量调整窗口层级失败，逐个应用")
+        for widget in widgets:
+            widget._apply_top_state()
+
     def _is_on_resize_handle(self, pos):
         """检查鼠标是否在调整大小手柄区域"""
         m = self.SHADOW_MARGIN
@@ -504,13 +1157,12 @@ class BaseWidget(QFrame):
         total_h = new_height + self.SHADOW_MARGIN * 2
         self.setFixedSize(total_w, total_h)
 
-        # 保存到配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["custom_width"] = new_width
-                widget_config["custom_height"] = new_height
-                break
-        config.save()
+        # 保存到配置（拖拽过程中每次移动都会调用，合并为一次写入）
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["custom_width"] = new_width
+            widget_config["custom_height"] = new_height
+        config.save_later()
 
     def _setup_ui(self):
         """设置UI（子类实现）"""
@@ -522,30 +1174,12 @@ class BaseWidget(QFrame):
         # 标题栏
         self.header = QHBoxLayout()
         self.title_label = QLabel(self.widget_name)
-        self.title_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 12px;
-            font-weight: 500;
-        """)
+        apply_style_sheet(self.title_label, theme.qss(self.TITLE_QSS))
         self.header.addWidget(self.title_label)
         self.header.addStretch()
 
         # 关闭按钮
-        self.close_btn = QPushButton("×")
-        self.close_btn.setFixedSize(20, 20)
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                color: {theme.text_secondary};
-                border: none;
-                font-size: 16px;
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background: {theme.error};
-                color: white;
-            }}
-        """)
+        self.close_btn = CloseButton()
         self.close_btn.clicked.connect(self._on_close)
         self.header.addWidget(self.close_btn)
 
@@ -562,41 +1196,81 @@ class BaseWidget(QFrame):
 
     def update_style(self):
         """更新样式（切换主题时调用）"""
-        self.title_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 12px;
-            font-weight: 500;
-        """)
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                color: {theme.text_secondary};
-                border: none;
-                font-size: 16px;
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background: {theme.error};
-                color: white;
-            }}
-        """)
+        apply_style_sheet(self.title_label, theme.qss(self.TITLE_QSS))
+        self.close_btn.update_style()
+        if self._ctx_menu is not None:
+            apply_style_sheet(self._ctx_menu, theme.qss(MENU_QSS))
+
+    def refresh_theme(self):
+        """主题变化后刷新样式；隐藏的组件推迟到下次显示时再刷新，已是最新时跳过"""
+        if self._style_version == theme.version or not self.isVisible():
+            return
+        self._style_version = theme.version
+        self.update_style()
+        self.update()
 
     def showEvent(self, event):
         super().showEvent(event)
+        self.refresh_theme()
         self.opacity_animation.start()
+        if self._updates_paused:
+            self._updates_paused = False
+            self._resume_updates()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not self._updates_paused:
+            self._updates_paused = True
+            self._pause_updates()
+
+    def _pause_updates(self):
+        """隐藏时暂停节拍订阅和定时器（子类可扩展）"""
+        bus = tick_bus()
+        for slot, pause_when_hidden in self._tick_slots:
+            if pause_when_hidden:
+                try:
+                    bus.timeout.disconnect(slot)
+                except TypeError:
+                    pass
+        for timer in self._timers:
+            if timer.isActive():
+                timer.stop()
+                self._stopped_timers.append(timer)
+
+    def _resume_updates(self):
+        """重新显示时恢复节拍订阅和定时器，并立即刷新一次"""
+        bus = tick_bus()
+        for slot, pause_when_hidden in self._tick_slots:
+            if pause_when_hidden:
+                bus.timeout.connect(slot)
+                slot()
+        for timer in self._stopped_timers:
+            timer.start()
+        self._stopped_timers.clear()
 
     def update_content(self):
         """更新内容（子类实现）"""
         pass
 
+    def run_in_background(self, fn, on_done, *args, on_error=None):
+        """在线程池中执行阻塞调用，完成后在主线程回调 on_done(result)"""
+        task = BackgroundTask(fn, *args)
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(on_error or self._on_background_failed)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def _on_background_failed(self, error):
+        """后台任务失败的默认处理"""
+        logger.error(f"{self.widget_name} 后台任务失败: {error}")
+
     def _on_close(self):
         # 保存当前位置（仅在配置中存在时）
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["position"] = [self.x(), self.y()]
-                widget_config["size"] = self.size_key
-                widget_config["click_through"] = self.click_through
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["position"] = [self.x(), self.y()]
+            widget_config["size"] = self.size_key
+            widget_config["click_through"] = self.click_through
         config.save()
 
         # 从全局列表中移除
@@ -612,6 +1286,31 @@ class BaseWidget(QFrame):
         self.close_animation.finished.connect(lambda: self._finish_close())
         self.close_animation.start()
 
+    def _subscribe_tick(self, slot, pause_when_hidden: bool = True):
+        """订阅全局 1 秒节拍，组件关闭时自动取消；隐藏期间默认暂停"""
+        tick_bus().timeout.connect(slot)
+        self._tick_slots.append((slot, pause_when_hidden))
+
+    def _register_timer(self, timer: QTimer) -> QTimer:
+        """登记组件自有定时器，隐藏时自动暂停"""
+        self._timers.append(timer)
+        return timer
+
+    def closeEvent(self, event):
+        # 取消节拍订阅，已关闭的组件不再刷新
+        bus = tick_bus()
+        for slot, _ in self._tick_slots:
+            try:
+                bus.timeout.disconnect(slot)
+            except TypeError:
+                pass
+        self._tick_slots.clear()
+        try:
+            WidgetOpacity.instance().changed.disconnect(self.update)
+        except TypeError:
+            pass
+        super().closeEvent(event)
+
     def _finish_close(self):
         """完成关闭"""
         self.closed.emit(self.widget_id)
@@ -622,31 +1321,21 @@ class BaseWidget(QFrame):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # 计算内容区域（减去阴影边距）
         m = self.SHADOW_MARGIN
-        content_rect = QRect(m, m, self.width() - m * 2, self.height() - m * 2)
 
-        # 绘制阴影
-        shadow_color = QColor(0, 0, 0, 40)
-        for i in range(5, 0, -1):
-            offset = i * 2
-            shadow_rect = content_rect.adjusted(-offset, -offset, offset, offset)
-            shadow_color.setAlpha(40 - i * 6)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(shadow_color))
-            painter.drawRoundedRect(shadow_rect, 16 + offset, 16 + offset)
+        # 绘制阴影（按尺寸缓存）
+        painter.drawPixmap(0, 0, self._shadow_pixmap())
+
+        if self._content_path is None:
+            self._update_content_path()
 
         # 绘制背景
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(QColor(theme.bg_widget)))
         painter.setOpacity(self.opacity)
-        painter.drawRoundedRect(content_rect, 16, 16)
+        painter.fillPath(self._content_path, QColor(theme.bg_widget))
 
         # 绘制边框
-        painter.setPen(QPen(QColor(theme.border), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.setOpacity(1)
-        painter.drawRoundedRect(content_rect, 16, 16)
+        painter.strokePath(self._content_path, QPen(QColor(theme.border), 1))
 
         # 绘制吸附指示器
         if self._snap_indicator_rect:
@@ -671,6 +1360,47 @@ class BaseWidget(QFrame):
 
         super().paintEvent(event)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_content_path()
+
+    def _update_content_path(self):
+        """重建内容区域的圆角路径"""
+        m = self.SHADOW_MARGIN
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(m, m, self.width() - m * 2, self.height() - m * 2), 16.0, 16.0)
+        self._content_path = path
+
+    def _shadow_pixmap(self) -> QPixmap:
+        """获取当前尺寸的阴影像素图（通过 QPixmapCache 缓存）"""
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        cache_key = f"shadow:{w}x{h}@{dpr}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        pixmap = QPixmap(int(w * dpr), int(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        m = self.SHADOW_MARGIN
+        content_rect = QRect(m, m, w - m * 2, h - m * 2)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        shadow_color = QColor(0, 0, 0, 40)
+        for i in range(5, 0, -1):
+            offset = i * 2
+            shadow_rect = content_rect.adjusted(-offset, -offset, offset, offset)
+            shadow_color.setAlpha(40 - i * 6)
+            painter.setBrush(QBrush(shadow_color))
+            painter.drawRoundedRect(shadow_rect, 16 + offset, 16 + offset)
+        painter.end()
+
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             local_pos = event.position().toPoint()
@@ -708,12 +1438,11 @@ class BaseWidget(QFrame):
         self.update()
 
         # 保存位置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["position"] = [self.x(), self.y()]
-                widget_config["size"] = self.size_key
-                widget_config["click_through"] = self.click_through
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["position"] = [self.x(), self.y()]
+            widget_config["size"] = self.size_key
+            widget_config["click_through"] = self.click_through
         config.save()
 
         super().mouseReleaseEvent(event)
@@ -836,56 +1565,23 @@ class BaseWidget(QFrame):
         return None
 
     def contextMenuEvent(self, event):
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 6px 4px;
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-            }}
-            QMenu::item {{
-                padding: 8px 28px 8px 16px;
-                border-radius: 4px;
-                background: transparent;
-                color: {theme.text_primary};
-                margin: 1px 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.bg_hover};
-            }}
-            QMenu::item:pressed {{
-                background-color: {theme.bg_pressed};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme.border};
-                margin: 4px 12px;
-            }}
-            QMenu::indicator {{
-                width: 16px;
-                height: 16px;
-                margin-left: 8px;
-            }}
-            QMenu::indicator:checked {{
-                background-color: {theme.accent};
-                border: none;
-                border-radius: 3px;
-            }}
-            QMenu::indicator:unchecked {{
-                background-color: transparent;
-                border: 2px solid {theme.text_tertiary};
-                border-radius: 3px;
-            }}
-        """)
-
+        if self._ctx_menu is None:
+            self._ctx_menu = QMenu(self)
+            apply_style_sheet(self._ctx_menu, theme.qss(MENU_QSS))
+            self._build_context_menu(self._ctx_menu)
+        self._update_context_menu()
+        self._ctx_menu.exec(event.globalPos())
+
+    def _build_context_menu(self, menu: QMenu):
+        """构建右键菜单（子类可覆盖，在通用选项前添加专属选项）"""
+        self._build_common_menu_actions(menu)
+
+    def _build_common_menu_actions(self, menu: QMenu):
+        """添加通用选项：鼠标穿透、窗口层级、关闭"""
         # 鼠标穿透选项
-        click_through_action = menu.addAction("鼠标穿透")
-        click_through_action.setCheckable(True)
-        click_through_action.setChecked(self.click_through)
-        click_through_action.triggered.connect(self._toggle_click_through)
+        self._click_through_action = menu.addAction("鼠标穿透")
+        self._click_through_action.setCheckable(True)
+        self._click_through_action.triggered.connect(self._toggle_click_through)
 
         menu.addSeparator()
 
@@ -901,83 +1597,44 @@ class BaseWidget(QFrame):
         close_action = menu.addAction("关闭小组件")
         close_action.triggered.connect(self._on_close)
 
-        menu.exec(event.globalPos())
+    def _update_context_menu(self):
+        """打开菜单前同步可勾选项的状态（子类可覆盖）"""
+        self._click_through_action.setChecked(self.click_through)
 
     def _bring_to_top(self):
         """置顶显示 - 使用Windows API实现持久置顶"""
         self.always_on_top = True
-
-        # 更新窗口标志，添加置顶属性
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.WindowStaysOnTopHint |
-            Qt.WindowType.Tool
-        )
-        self.show()
-
-        hwnd = int(self.winId())
-
-        # 设置窗口为始终置顶
-        HWND_TOPMOST = -1
-        SWP_NOSIZE = 0x0001
-        SWP_NOMOVE = 0x0002
-
-        ctypes.windll.user32.SetWindowPos(
-            hwnd, HWND_TOPMOST,
-            0, 0, 0, 0,
-            SWP_NOSIZE | SWP_NOMOVE
-        )
+        self._set_window_layer(True)
 
         # 保存配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["always_on_top"] = True
-                break
-        config.save()
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["always_on_top"] = True
+        config.save_later()
 
     def _send_to_bottom(self):
         """置底显示 - 取消置顶并移到底层"""
         self.always_on_top = False
-
-        # 更新窗口标志，移除置顶属性
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.Tool
-        )
-        self.show()
-
-        hwnd = int(self.winId())
-
-        # 取消置顶
-        HWND_NOTOPMOST = -2
-        SWP_NOSIZE = 0x0001
-        SWP_NOMOVE = 0x0002
-
-        ctypes.windll.user32.SetWindowPos(
-            hwnd, HWND_NOTOPMOST,
-            0, 0, 0, 0,
-            SWP_NOSIZE | SWP_NOMOVE
-        )
+        self._set_window_layer(False)
 
         # 移到最底层
         self.lower()
 
         # 保存配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["always_on_top"] = False
-                break
-        config.save()
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["always_on_top"] = False
+        config.save_later()
 
     def _toggle_click_through(self):
         """切换鼠标穿透模式 - 使用Windows API"""
         self.click_through = not self.click_through
 
         # 获取窗口句柄
-        hwnd = int(self.winId())
+        hwnd = self._get_hwnd()
 
         # 获取当前扩展窗口样式
-        ex_style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+        ex_style = _GetWindowLongW(hwnd, GWL_EXSTYLE)
 
         if self.click_through:
             # 添加透明和分层样式
@@ -987,14 +1644,13 @@ class BaseWidget(QFrame):
             ex_style &= ~WS_EX_TRANSPARENT
 
         # 设置新的扩展窗口样式
-        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
+        _SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
 
         # 保存配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["click_through"] = self.click_through
-                break
-        config.save()
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["click_through"] = self.click_through
+        config.save_later()
 
     def _on_size_changed(self):
         """大小改变时的回调，子类可覆盖"""
@@ -1010,6 +1666,24 @@ class ClockWidget(BaseWidget):
         "large": 56
     }
 
+    # 内容区样式统一设置在组件上，按对象名匹配各标签
+    CONTENT_QSS = """
+            QLabel#clock_time {{
+                font-size: {font_size}px;
+                font-weight: 300;
+                color: {text_primary};
+            }}
+            QLabel#clock_seconds {{
+                font-size: {seconds_font_size}px;
+                font-weight: 300;
+                color: {accent};
+            }}
+            QLabel#clock_date {{
+                font-size: 13px;
+                color: {text_secondary};
+            }}
+        """
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.show_seconds = False  # 默认关闭秒数显示
         super().__init__(widget_id, "时钟", size)
@@ -1019,14 +1693,17 @@ class ClockWidget(BaseWidget):
 
         # 时间显示
         self.time_label = QLabel()
+        self.time_label.setObjectName("clock_time")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # 秒数显示
         self.seconds_label = QLabel()
+        self.seconds_label.setObjectName("clock_seconds")
         self.seconds_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # 日期显示
         self.date_label = QLabel()
+        self.date_label.setObjectName("clock_date")
         self.date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self._apply_styles()
@@ -1040,20 +1717,9 @@ class ClockWidget(BaseWidget):
 
     def _apply_styles(self):
         font_size = self.FONT_SIZES.get(self.size_key, 42)
-        self.time_label.setStyleSheet(f"""
-            font-size: {font_size}px;
-            font-weight: 300;
-            color: {theme.text_primary};
-        """)
-        self.seconds_label.setStyleSheet(f"""
-            font-size: {font_size // 2}px;
-            font-weight: 300;
-            color: {theme.accent};
-        """)
-        self.date_label.setStyleSheet(f"""
-            font-size: 13px;
-            color: {theme.text_secondary};
-        """)
+        apply_style_sheet(self, theme.qss(
+            self.CONTENT_QSS, font_size=font_size, seconds_font_size=font_size // 2
+        ))
 
     def update_style(self):
         """更新样式"""
@@ -1074,58 +1740,19 @@ class ClockWidget(BaseWidget):
             self.seconds_label.hide()
         self.date_label.setText(now.strftime("%Y年%m月%d日 %A"))
 
-    def contextMenuEvent(self, event):
+    def _build_context_menu(self, menu: QMenu):
         """右键菜单"""
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 6px 4px;
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-            }}
-            QMenu::item {{
-                padding: 8px 28px 8px 16px;
-                border-radius: 4px;
-                background: transparent;
-                color: {theme.text_primary};
-                margin: 1px 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.bg_hover};
-            }}
-        """)
-
         # 秒数显示选项
-        seconds_action = menu.addAction("显示秒数")
-        seconds_action.setCheckable(True)
-        seconds_action.setChecked(self.show_seconds)
-        seconds_action.triggered.connect(self._toggle_seconds)
-
-        menu.addSeparator()
-
-        # 窗口层级选项
-        top_action = menu.addAction("置顶显示")
-        top_action.triggered.connect(self._bring_to_top)
-
-        bottom_action = menu.addAction("置底显示")
-        bottom_action.triggered.connect(self._send_to_bottom)
-
-        menu.addSeparator()
-
-        # 鼠标穿透选项
-        click_through_action = menu.addAction("鼠标穿透")
-        click_through_action.setCheckable(True)
-        click_through_action.setChecked(self.click_through)
-        click_through_action.triggered.connect(self._toggle_click_through)
+        self._seconds_action = menu.addAction("显示秒数")
+        self._seconds_action.setCheckable(True)
+        self._seconds_action.triggered.connect(self._toggle_seconds)
 
         menu.addSeparator()
-        close_action = menu.addAction("关闭小组件")
-        close_action.triggered.connect(self._on_close)
+        super()._build_context_menu(menu)
 
-        menu.exec(event.globalPos())
+    def _update_context_menu(self):
+        super()._update_context_menu()
+        self._seconds_action.setChecked(self.show_seconds)
 
     def _toggle_seconds(self):
         """切换秒数显示"""
@@ -1135,7 +1762,30 @@ class ClockWidget(BaseWidget):
 
 class SystemMonitorWidget(BaseWidget):
     """系统监控小组件"""
+    CONTENT_QSS = """
+            QLabel#monitor_label {{
+                color: {text_primary};
+                font-size: 14px;
+            }}
+            QProgressBar {{
+                border: none;
+                border-radius: 4px;
+                background: {border};
+                height: 8px;
+                text-align: center;
+            }}
+            QProgressBar::chunk {{
+                border-radius: 4px;
+                background: {accent};
+            }}
+        """
+
     def __init__(self, widget_id: str, size: str = "medium"):
+        # 预热CPU采样，之后 interval=None 的调用返回距上次调用的占用率，不会阻塞
+        psutil.cpu_percent(interval=None)
+        # 上次显示的数值（以 0.1% 为单位），未变化时跳过标签和进度条刷新
+        self._last_cpu_tenths = -1
+        self._last_mem_tenths = -1
         super().__init__(widget_id, "系统监控", size)
 
     def _setup_ui(self):
@@ -1143,15 +1793,15 @@ class SystemMonitorWidget(BaseWidget):
 
         # CPU
         self.cpu_label = QLabel("CPU: ---%")
-        self.cpu_label.setStyleSheet(f"color: {theme.text_primary}; font-size: 14px;")
+        self.cpu_label.setObjectName("monitor_label")
 
         # 内存
         self.mem_label = QLabel("内存: ---%")
-        self.mem_label.setStyleSheet(f"color: {theme.text_primary}; font-size: 14px;")
+        self.mem_label.setObjectName("monitor_label")
 
         self.cpu_bar = QProgressBar()
         self.mem_bar = QProgressBar()
-        self._apply_progress_style()
+        self._apply_styles()
 
         self.cpu_bar.setMaximumHeight(8)
         self.cpu_bar.setTextVisible(False)
@@ -1165,44 +1815,37 @@ class SystemMonitorWidget(BaseWidget):
         self._main_layout.addWidget(self.mem_bar)
         self._main_layout.addStretch()
 
-    def _apply_progress_style(self):
-        """应用进度条样式"""
-        style = f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                background: {theme.border};
-                height: 8px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                border-radius: 4px;
-                background: {theme.accent};
-            }}
-        """
-        self.cpu_bar.setStyleSheet(style)
-        self.mem_bar.setStyleSheet(style)
+    def _apply_styles(self):
+        """应用标签和进度条样式（一次设置在组件上，由子控件继承）"""
+        apply_style_sheet(self, theme.qss(self.CONTENT_QSS))
 
     def update_style(self):
         """更新样式"""
         super().update_style()
-        self.cpu_label.setStyleSheet(f"color: {theme.text_primary}; font-size: 14px;")
-        self.mem_label.setStyleSheet(f"color: {theme.text_primary}; font-size: 14px;")
-        self._apply_progress_style()
+        self._apply_styles()
 
     def update_content(self):
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory()
+        cpu_percent = psutil.cpu_percent(interval=None)
+        mem_percent = psutil.virtual_memory().percent
 
-        self.cpu_label.setText(f"CPU: {cpu_percent:.1f}%")
-        self.cpu_bar.setValue(int(cpu_percent))
+        cpu_tenths = round(cpu_percent * 10)
+        if cpu_tenths != self._last_cpu_tenths:
+            self._last_cpu_tenths = cpu_tenths
+            self.cpu_label.setText(f"CPU: {cpu_percent:.1f}%")
+            self.cpu_bar.setValue(int(cpu_percent))
 
-        self.mem_label.setText(f"内存: {mem.percent:.1f}%")
-        self.mem_bar.setValue(int(mem.percent))
+        mem_tenths = round(mem_percent * 10)
+        if mem_tenths != self._last_mem_tenths:
+            self._last_mem_tenths = mem_tenths
+            self.mem_label.setText(f"内存: {mem_percent:.1f}%")
+            self.mem_bar.setValue(int(mem_percent))
 
 
 class TimerWidget(BaseWidget):
     """计时器小组件"""
+    # 按节拍累加计时，隐藏期间也不能停
+    TICK_WHEN_HIDDEN = True
+
     # 尺寸对应的字体大小
     FONT_SIZES = {
         "small": 24,
@@ -1210,22 +1853,50 @@ class TimerWidget(BaseWidget):
         "large": 48
     }
 
+    # 按对象名匹配，避免影响标题栏的关闭按钮
+    CONTENT_QSS = """
+            QLabel#timer_display {{
+                font-size: {font_size}px;
+                font-weight: 300;
+                color: {text_primary};
+            }}
+            QPushButton#timer_button {{
+                background: {accent};
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 8px 20px;
+                font-size: 13px;
+                font-weight: 500;
+            }}
+            QPushButton#timer_button:hover {{
+                background: {accent_hover};
+            }}
+            QPushButton#timer_button:pressed {{
+                background: {text_primary};
+            }}
+        """
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.timer_seconds = 0
         self.is_running = False
+        self._shown_seconds = 0  # 当前显示的秒数
         super().__init__(widget_id, "计时器", size)
 
     def _setup_ui(self):
         super()._setup_ui()
 
         self.display = QLabel("00:00:00")
+        self.display.setObjectName("timer_display")
         self.display.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.start_btn = QPushButton("开始")
+        self.start_btn.setObjectName("timer_button")
         self.start_btn.setFixedHeight(36)
         self.start_btn.clicked.connect(self._toggle_timer)
 
         self.reset_btn = QPushButton("重置")
+        self.reset_btn.setObjectName("timer_button")
         self.reset_btn.setFixedHeight(36)
         self.reset_btn.clicked.connect(self._reset_timer)
 
@@ -1245,30 +1916,7 @@ class TimerWidget(BaseWidget):
     def _apply_styles(self):
         """应用样式"""
         font_size = self.FONT_SIZES.get(self.size_key, 36)
-        self.display.setStyleSheet(f"""
-            font-size: {font_size}px;
-            font-weight: 300;
-            color: {theme.text_primary};
-        """)
-        btn_style = f"""
-            QPushButton {{
-                background: {theme.accent};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background: {theme.accent_hover};
-            }}
-            QPushButton:pressed {{
-                background: {theme.text_primary};
-            }}
-        """
-        self.start_btn.setStyleSheet(btn_style)
-        self.reset_btn.setStyleSheet(btn_style)
+        apply_style_sheet(self, theme.qss(self.CONTENT_QSS, font_size=font_size))
 
     def update_style(self):
         """更新样式"""
@@ -1285,22 +1933,36 @@ class TimerWidget(BaseWidget):
     def _reset_timer(self):
         self.is_running = False
         self.timer_seconds = 0
+        self._shown_seconds = 0
         self.start_btn.setText("开始")
         self.display.setText("00:00:00")
 
     def update_content(self):
         if self.is_running:
             self.timer_seconds += 1
-        hours = self.timer_seconds // 3600
-        minutes = (self.timer_seconds % 3600) // 60
-        seconds = self.timer_seconds % 60
-        self.display.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        # 暂停时数值不变，跳过格式化和重绘
+        if self.timer_seconds == self._shown_seconds:
+            return
+        self._shown_seconds = self.timer_seconds
+        self.display.setText(format_hms(self.timer_seconds))
 
 
 class NotesWidget(BaseWidget):
     """笔记小组件"""
+    TEXT_EDIT_QSS = """
+            QTextEdit {{
+                background: transparent;
+                border: none;
+                color: {text_primary};
+                font-size: 14px;
+            }}
+        """
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.note_text = ""
+        widget_config = config.get_widget(widget_id)
+        if widget_config is not None:
+            self.note_text = widget_config.get("note_text", "")
         super().__init__(widget_id, "笔记", size)
 
     def _setup_ui(self):
@@ -1308,21 +1970,21 @@ class NotesWidget(BaseWidget):
 
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("在这里输入笔记...")
+        self.text_edit.setPlainText(self.note_text)
         self._apply_style()
-        self.text_edit.textChanged.connect(self._save_note)
+
+        # 输入停顿后再读取文本并保存，连续输入只保存一次
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._write_note)
+        self.text_edit.document().contentsChange.connect(self._save_note)
 
         self._main_layout.addWidget(self.text_edit)
 
     def _apply_style(self):
         """应用样式"""
-        self.text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background: transparent;
-                border: none;
-                color: {theme.text_primary};
-                font-size: 14px;
-            }}
-        """)
+        apply_style_sheet(self.text_edit, theme.qss(self.TEXT_EDIT_QSS))
 
     def update_style(self):
         """更新样式"""
@@ -1332,8 +1994,30 @@ class NotesWidget(BaseWidget):
     def _on_size_changed(self):
         self._apply_style()
 
-    def _save_note(self):
+    def _save_note(self, position, chars_removed, chars_added):
+        # 只改格式、未增删字符时无需保存
+        if chars_removed or chars_added:
+            self._save_timer.start()
+
+    def _write_note(self):
+        """读取笔记内容并写入配置"""
+        document = self.text_edit.document()
+        # 撤销回上次保存的内容时文档不再是已修改状态，跳过读取整篇文本
+        if not document.isModified():
+            return
+        document.setModified(False)
         self.note_text = self.text_edit.toPlainText()
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["note_text"] = self.note_text
+            config.save_later()
+
+    def closeEvent(self, event):
+        # 关闭前写入尚未保存的输入
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._write_note()
+        super().closeEvent(event)
 
     def update_content(self):
         pass
@@ -1432,26 +2116,12 @@ class ImageCropDialog(QDialog):
         if self.original_pixmap.isNull():
             return
             
-        img_w = self.original_pixmap.width()
-        img_h = self.original_pixmap.height()
-        img_ratio = img_w / img_h
-        
-        # 计算裁剪区域（保持目标比例，覆盖整个图片）
-        if img_ratio > self.target_ratio:
-            # 图片更宽，以高度为准
-            crop_h = img_h
-            crop_w = int(crop_h * self.target_ratio)
-        else:
-            # 图片更高，以宽度为准
-            crop_w = img_w
-            crop_h = int(crop_w / self.target_ratio)
-            
-        self.crop_w = crop_w
-        self.crop_h = crop_h
-        
-        # 初始居中
-        self.crop_offset_x = (img_w - crop_w) // 2
-        self.crop_offset_y = (img_h - crop_h) // 2
+        # 计算裁剪区域（保持目标比例，初始居中）
+        rect = center_crop_rect(self.original_pixmap.width(), self.original_pixmap.height(), self.target_ratio)
+        self.crop_w = rect.width()
+        self.crop_h = rect.height()
+        self.crop_offset_x = rect.x()
+        self.crop_offset_y = rect.y()
         
     def get_crop_rect(self) -> QRect:
         """获取裁剪区域"""
@@ -1477,84 +2147,120 @@ class CropPreviewWidget(QFrame):
         self.is_dragging = False
         self.drag_start_pos = None
         self.drag_start_offset = None
-        
-    def paintEvent(self, event):
-        """绘制裁剪预览"""
-        super().paintEvent(event)
-        
-        if self.dialog.original_pixmap.isNull():
+
+        # 缩放后的预览图缓存（控件尺寸变化时失效）
+        self._scaled_pixmap = None
+        self._display_rect = QRect()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._scaled_pixmap = None
+
+    def _ensure_scaled_pixmap(self):
+        """按当前控件尺寸缩放原图（仅在尺寸变化后执行一次）"""
+        if self._scaled_pixmap is not None:
             return
-            
+
         preview_rect = self.rect()
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        
-        # 设置圆角裁剪
-        painter.setClipRect(preview_rect)
-        
-        img_w = self.dialog.original_pixmap.width()
-        img_h = self.dialog.original_pixmap.height()
-        
+        original = self.dialog.original_pixmap
+        img_w = original.width()
+        img_h = original.height()
+
         # 计算图片适应预览区域的缩放比例
         scale_x = preview_rect.width() / img_w
         scale_y = preview_rect.height() / img_h
         self.dialog.display_scale = min(scale_x, scale_y)
-        
+
         display_w = int(img_w * self.dialog.display_scale)
         display_h = int(img_h * self.dialog.display_scale)
-        
+
         # 图片显示位置（居中）
         display_x = (preview_rect.width() - display_w) // 2
         display_y = (preview_rect.height() - display_h) // 2
-        
-        # 绘制图片
-        painter.drawPixmap(
-            QRect(display_x, display_y, display_w, display_h),
-            self.dialog.original_pixmap
+        self._display_rect = QRect(display_x, display_y, display_w, display_h)
+
+        dpr = self.devicePixelRatioF()
+        scaled = original.scaled(
+            int(display_w * dpr), int(display_h * dpr),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
         )
-        
+        scaled.setDevicePixelRatio(dpr)
+        self._scaled_pixmap = scaled
+
+    def paintEvent(self, event):
+        """绘制裁剪预览"""
+        super().paintEvent(event)
+
+        if self.dialog.original_pixmap.isNull():
+            return
+
+        self._ensure_scaled_pixmap()
+
+        preview_rect = self.rect()
+        # 预览图已按设备像素比缩放好，且遮罩、边框都是轴对齐矩形，无需抗锯齿和平滑变换
+        painter = QPainter(self)
+
+        # 只绘制缓存图片中落在重绘区域内的部分（QPainter 已按重绘区域裁剪，无需再设裁剪矩形）
+        display_x = self._display_rect.x()
+        display_y = self._display_rect.y()
+        dirty = event.rect() & self._display_rect
+        if not dirty.isEmpty():
+            dpr = self._scaled_pixmap.devicePixelRatio()
+            source = QRectF(dirty.translated(-display_x, -display_y))
+            source = QRectF(source.x() * dpr, source.y() * dpr,
+                            source.width() * dpr, source.height() * dpr)
+            painter.drawPixmap(QRectF(dirty), self._scaled_pixmap, source)
+
         # 计算裁剪框位置
-        crop_display_x = display_x + int(self.dialog.crop_offset_x * self.dialog.display_scale)
-        crop_display_y = display_y + int(self.dialog.crop_offset_y * self.dialog.display_scale)
-        crop_display_w = int(self.dialog.crop_w * self.dialog.display_scale)
-        crop_display_h = int(self.dialog.crop_h * self.dialog.display_scale)
-        
-        # 绘制半透明遮罩
+        crop_rect = self._crop_display_rect()
+        crop_display_x = crop_rect.x()
+        crop_display_y = crop_rect.y()
+        crop_display_w = crop_rect.width()
+        crop_display_h = crop_rect.height()
+
+        # 在裁剪框四周绘制半透明遮罩（裁剪区域保持原图）
         overlay_color = QColor(0, 0, 0, 150)
-        painter.fillRect(preview_rect, overlay_color)
-        
-        # 清除裁剪区域的遮罩，显示原图
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-        painter.fillRect(QRect(crop_display_x, crop_display_y, crop_display_w, crop_display_h), Qt.GlobalColor.transparent)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-        
-        # 重新绘制裁剪区域的图片
-        painter.drawPixmap(
-            QRect(crop_display_x, crop_display_y, crop_display_w, crop_display_h),
-            self.dialog.original_pixmap,
-            QRect(self.dialog.crop_offset_x, self.dialog.crop_offset_y, self.dialog.crop_w, self.dialog.crop_h)
-        )
-        
+        full_w = preview_rect.width()
+        full_h = preview_rect.height()
+        crop_right = crop_display_x + crop_display_w
+        crop_bottom = crop_display_y + crop_display_h
+        painter.fillRect(QRect(0, 0, full_w, crop_display_y), overlay_color)
+        painter.fillRect(QRect(0, crop_bottom, full_w, full_h - crop_bottom), overlay_color)
+        painter.fillRect(QRect(0, crop_display_y, crop_display_x, crop_display_h), overlay_color)
+        painter.fillRect(QRect(crop_right, crop_display_y, full_w - crop_right, crop_display_h), overlay_color)
+
         # 绘制裁剪框边框
         painter.setPen(QPen(QColor(theme.accent), 2))
         painter.drawRect(crop_display_x, crop_display_y, crop_display_w, crop_display_h)
-        
+
         # 绘制网格线（三分法）
         painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
         third_w = crop_display_w // 3
-        painter.drawLine(crop_display_x + third_w, crop_display_y,
-                        crop_display_x + third_w, crop_display_y + crop_display_h)
-        painter.drawLine(crop_display_x + third_w * 2, crop_display_y,
-                        crop_display_x + third_w * 2, crop_display_y + crop_display_h)
         third_h = crop_display_h // 3
-        painter.drawLine(crop_display_x, crop_display_y + third_h,
-                        crop_display_x + crop_display_w, crop_display_y + third_h)
-        painter.drawLine(crop_display_x, crop_display_y + third_h * 2,
-                        crop_display_x + crop_display_w, crop_display_y + third_h * 2)
-        
+        painter.drawLines([
+            QLine(crop_display_x + third_w, crop_display_y,
+                  crop_display_x + third_w, crop_bottom),
+            QLine(crop_display_x + third_w * 2, crop_display_y,
+                  crop_display_x + third_w * 2, crop_bottom),
+            QLine(crop_display_x, crop_display_y + third_h,
+                  crop_right, crop_display_y + third_h),
+            QLine(crop_display_x, crop_display_y + third_h * 2,
+                  crop_right, crop_display_y + third_h * 2),
+        ])
+
         painter.end()
-        
+
+    def _crop_display_rect(self) -> QRect:
+        """裁剪框在控件中的显示位置"""
+        scale = self.dialog.display_scale
+        return QRect(
+            self._display_rect.x() + int(self.dialog.crop_offset_x * scale),
+            self._display_rect.y() + int(self.dialog.crop_offset_y * scale),
+            int(self.dialog.crop_w * scale),
+            int(self.dialog.crop_h * scale)
+        )
+
     def mousePressEvent(self, event):
         """鼠标按下"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -1582,11 +2288,17 @@ class CropPreviewWidget(QFrame):
             
             new_x = max(0, min(new_x, img_w - self.dialog.crop_w))
             new_y = max(0, min(new_y, img_h - self.dialog.crop_h))
-            
+
+            # 裁剪框未移动（如已到边界或亚像素移动）时不重绘
+            if (new_x, new_y) == (self.dialog.crop_offset_x, self.dialog.crop_offset_y):
+                return
+
+            old_rect = self._crop_display_rect()
             self.dialog.crop_offset_x = new_x
             self.dialog.crop_offset_y = new_y
-            
-            self.update()
+
+            # 只有新旧裁剪框覆盖的区域会变化（外扩边框线宽），其余遮罩保持不变
+            self.update(old_rect.united(self._crop_display_rect()).adjusted(-2, -2, 2, 2))
             
         elif not self.is_dragging:
             # 鼠标悬停时显示手型光标
@@ -1606,11 +2318,76 @@ class CropPreviewWidget(QFrame):
 
 class MusicWidget(BaseWidget):
     """音乐控制小组件 - 控制系统媒体播放"""
+    # 常见媒体播放器进程名（小写，匹配时不区分大小写）
+    MEDIA_PLAYERS = frozenset({
+        'spotify.exe', 'music.ui.exe', 'aimp.exe', 'foobar2000.exe',
+        'winamp.exe', 'vlc.exe', 'musicbee.exe', 'applemusic.exe',
+        'youtube music.exe', 'neteasecloudmusic.exe', 'cloudmusic.exe',
+        'qqmusic.exe', 'kugou.exe', 'kwmusic.exe'
+    })
+    APP_LABEL_QSS = """
+            color: {text_secondary};
+            font-size: 11px;
+            background: transparent;
+        """
+
+    TRACK_LABEL_QSS = """
+            color: {text_primary};
+            font-size: 13px;
+            font-weight: 500;
+            background: transparent;
+        """
+
+    ARTIST_LABEL_QSS = """
+            color: {text_secondary};
+            font-size: 12px;
+            background: transparent;
+        """
+
+    # 会话进程名缓存（pid -> 进程名），避免每次扫描都重新打开进程读取名称
+    _process_names: dict = {}
+
+    PRIMARY_BUTTON_QSS = """
+                QPushButton {{
+                    background: {bg_hover};
+                    color: {text_primary};
+                    border: 1px solid {border};
+                    border-radius: 20px;
+                    font-size: 14px;
+                    padding: 8px;
+                }}
+                QPushButton:hover {{
+                    background: {bg_pressed};
+                    border-color: {text_tertiary};
+                }}
+                QPushButton:pressed {{
+                    background: {bg_card};
+                }}
+            """
+    BUTTON_QSS = """
+                QPushButton {{
+                    background: transparent;
+                    color: {text_secondary};
+                    border: 1px solid {border};
+                    border-radius: 20px;
+                    font-size: 14px;
+                    padding: 8px;
+                }}
+                QPushButton:hover {{
+                    background: {bg_hover};
+                    color: {text_primary};
+                }}
+                QPushButton:pressed {{
+                    background: {bg_pressed};
+                }}
+            """
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.current_app = ""
         self.track_title = ""
         self.track_artist = ""
         self.is_playing = False
+        self._scanning = False  # 后台扫描进行中
         super().__init__(widget_id, "音乐", size)
 
     def _setup_ui(self):
@@ -1618,32 +2395,17 @@ class MusicWidget(BaseWidget):
 
         # 应用信息显示
         self.app_label = QLabel("无媒体播放")
-        self.app_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 11px;
-            background: transparent;
-        """)
         self.app_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # 歌曲信息
         self.track_label = QLabel("")
-        self.track_label.setStyleSheet(f"""
-            color: {theme.text_primary};
-            font-size: 13px;
-            font-weight: 500;
-            background: transparent;
-        """)
         self.track_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.track_label.setWordWrap(True)
 
         # 艺术家信息
         self.artist_label = QLabel("")
-        self.artist_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 12px;
-            background: transparent;
-        """)
         self.artist_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._apply_label_styles()
 
         # 控制按钮容器
         controls = QHBoxLayout()
@@ -1686,65 +2448,22 @@ class MusicWidget(BaseWidget):
         self._style_button(self.play_btn, primary=True)
         self._style_button(self.next_btn)
 
-        # 定时器获取媒体信息
-        self.media_timer = QTimer(self)
-        self.media_timer.timeout.connect(self._update_media_info)
-        self.media_timer.start(1000)  # 每秒更新
+        # 定时器获取媒体信息（无 pycaw 时无法读取会话，不启动）
+        if PYCAW_AVAILABLE:
+            self._subscribe_tick(self._update_media_info)  # 每秒更新
 
     def _style_button(self, btn, primary=False):
         """设置按钮样式 - 优雅简约风格"""
-        if primary:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {theme.bg_hover};
-                    color: {theme.text_primary};
-                    border: 1px solid {theme.border};
-                    border-radius: 20px;
-                    font-size: 14px;
-                    padding: 8px;
-                }}
-                QPushButton:hover {{
-                    background: {theme.bg_pressed};
-                    border-color: {theme.text_tertiary};
-                }}
-                QPushButton:pressed {{
-                    background: {theme.bg_card};
-                }}
-            """)
-        else:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {theme.text_secondary};
-                    border: 1px solid {theme.border};
-                    border-radius: 20px;
-                    font-size: 14px;
-                    padding: 8px;
-                }}
-                QPushButton:hover {{
-                    background: {theme.bg_hover};
-                    color: {theme.text_primary};
-                }}
-                QPushButton:pressed {{
-                    background: {theme.bg_pressed};
-                }}
-            """)
+        template = self.PRIMARY_BUTTON_QSS if primary else self.BUTTON_QSS
+        apply_style_sheet(btn, theme.qss(template))
 
     def _send_media_key(self, key_code):
-        """发送媒体键 - 使用 keybd_event"""
-        import ctypes
-
-        KEYEVENTF_EXTENDEDKEY = 0x0001
-        KEYEVENTF_KEYUP = 0x0002
-
-        # 发送按键按下
-        ctypes.windll.user32.keybd_event(key_code, 0, KEYEVENTF_EXTENDEDKEY, 0)
-        # 发送按键释放
-        ctypes.windll.user32.keybd_event(key_code, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+        """发送媒体键 - 使用 SendInput 一次提交按下和释放"""
+        inputs = _MEDIA_KEY_INPUTS[key_code]
+        _SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
 
     def _toggle_play(self):
         """播放/暂停"""
-        VK_MEDIA_PLAY_PAUSE = 0xB3
         self._send_media_key(VK_MEDIA_PLAY_PAUSE)
         # 切换播放状态并更新按钮图标
         self.is_playing = not self.is_playing
@@ -1761,70 +2480,100 @@ class MusicWidget(BaseWidget):
 
     def _prev_track(self):
         """上一首"""
-        VK_MEDIA_PREV_TRACK = 0xB1
         self._send_media_key(VK_MEDIA_PREV_TRACK)
 
     def _next_track(self):
         """下一首"""
-        VK_MEDIA_NEXT_TRACK = 0xB0
         self._send_media_key(VK_MEDIA_NEXT_TRACK)
 
     def _update_media_info(self):
-        """更新媒体信息"""
-        try:
-            # 尝试获取当前播放的媒体信息
-            from pycaw.pycaw import AudioUtilities
-            sessions = AudioUtilities.GetAllSessions()
+        """更新媒体信息（会话扫描在线程池中执行）"""
+        if self._scanning:
+            return
+        self._scanning = True
+        self.run_in_background(self._scan_media_sessions, self._on_media_scanned,
+                               on_error=self._on_media_scan_failed)
 
-            found_media = False
-            was_playing = self.is_playing
-            self.is_playing = False
+    @classmethod
+    def _scan_media_sessions(cls):
+        """扫描音频会话查找媒体播放器（在后台线程执行）
 
-            for session in sessions:
-                if session.Process:
-                    process_name = session.Process.name()
-                    # 检查常见的媒体播放器
-                    media_players = [
-                        'Spotify.exe', 'Music.UI.exe', 'AIMP.exe', 'foobar2000.exe',
-                        'Winamp.exe', 'vlc.exe', 'MusicBee.exe', 'AppleMusic.exe',
-                        'YouTube Music.exe', 'NeteaseCloudMusic.exe', 'cloudmusic.exe',
-                        'QQMusic.exe', 'KuGou.exe', 'KwMusic.exe'
-                    ]
-                    if process_name in media_players or 'music' in process_name.lower():
-                        # 检查音频会话状态
-                        try:
-                            volume = session.SimpleAudioVolume
-                            if volume and volume.GetMasterVolume() > 0:
-                                # 获取音频会话状态
-                                state = session.State
-                                # State: 0 = Inactive, 1 = Active, 2 = Expired
-                                if state == 1:  # Active
-                                    self.is_playing = True
-                        except:
-                            self.is_playing = True  # 默认认为在播放
-
-                        app_name = process_name.replace('.exe', '')
-                        self.current_app = app_name
-                        self.app_label.setText(app_name)
-                        found_media = True
-                        break
-
-            if not found_media:
+        返回 (应用名, 是否在播放)，未找到时应用名为 None
+        """
+        # 工作线程需要单独初始化 COM
+        comtypes.CoInitialize()
+        # 只保留本次扫描到的会话，已消失的进程随之清除
+        names = {}
+        try:
+            for session in AudioUtilities.GetAllSessions():
+                pid = session.ProcessId
+                if not pid:
+                    continue  # 系统声音会话没有进程
+                process_name = cls._process_names.get(pid)
+                if process_name is None:
+                    proc = session.Process
+                    if not proc:
+                        continue
+                    process_name = proc.name()
+                names[pid] = process_name
+                name_lower = process_name.lower()
+                if name_lower not in cls.MEDIA_PLAYERS and 'music' not in name_lower:
+                    continue
+
+                # 只显示第一个匹配的播放器，找到后立即返回
+                is_playing = False
+                # 检查音频会话状态
+                try:
+                    volume = session.SimpleAudioVolume
+                    if volume and volume.GetMasterVolume() > 0:
+                        # State: 0 = Inactive, 1 = Active, 2 = Expired
+                        if session.State == 1:
+                            is_playing = True
+                except Exception:
+                    is_playing = True  # 默认认为在播放
+                return process_name[:-4] if name_lower.endswith('.exe') else process_name, is_playing
+            return None, False
+        finally:
+            cls._process_names = names
+            comtypes.CoUninitialize()
+
+    def _on_media_scanned(self, result):
+        """扫描完成，仅在状态变化时更新界面"""
+        self._scanning = False
+        app_name, is_playing = result
+        was_playing = self.is_playing
+
+        if app_name is None:
+            self.is_playing = False
+            if self.current_app:
+                self.current_app = ""
                 self.app_label.setText("无媒体播放")
                 self.track_label.setText("")
                 self.artist_label.setText("")
-                self.is_playing = False
+        else:
+            self.is_playing = is_playing
+            if app_name != self.current_app:
+                self.current_app = app_name
+                self.app_label.setText(app_name)
 
-            # 更新按钮图标
-            if was_playing != self.is_playing:
-                self._update_play_button()
+        # 更新按钮图标
+        if was_playing != self.is_playing:
+            self._update_play_button()
 
-        except Exception:
-            pass
+    def _on_media_scan_failed(self, error):
+        """扫描失败，保持当前显示"""
+        self._scanning = False
+
+    def _apply_label_styles(self):
+        """设置信息标签样式"""
+        apply_style_sheet(self.app_label, theme.qss(self.APP_LABEL_QSS))
+        apply_style_sheet(self.track_label, theme.qss(self.TRACK_LABEL_QSS))
+        apply_style_sheet(self.artist_label, theme.qss(self.ARTIST_LABEL_QSS))
 
     def update_style(self):
         """更新样式"""
         super().update_style()
+        self._apply_label_styles()
         self._style_button(self.prev_btn)
         self._style_button(self.play_btn, primary=True)
         self._style_button(self.next_btn)
@@ -1835,10 +2584,91 @@ class MusicWidget(BaseWidget):
 
 class WeatherWidget(BaseWidget):
     """天气小组件 - 显示实时天气信息"""
+    WEATHER_ICON_QSS = """
+            font-size: 14px;
+            font-weight: 500;
+            color: {accent};
+            background: transparent;
+        """
+    TEMP_LABEL_QSS = """
+            color: {text_primary};
+            font-size: 28px;
+            font-weight: 300;
+            background: transparent;
+        """
+    DESC_LABEL_QSS = """
+            color: {text_secondary};
+            font-size: 13px;
+            background: transparent;
+        """
+    LOCATION_LABEL_QSS = """
+            color: {text_tertiary};
+            font-size: 11px;
+            background: transparent;
+        """
+    DETAIL_LABEL_QSS = """
+            color: {text_secondary};
+            font-size: 11px;
+            background: transparent;
+        """
+
+    # 天气代码对应的文字描述
+    WEATHER_TEXTS = {
+        113: "晴",
+        116: "多云",
+        119: "阴",
+        122: "阴",
+        143: "雾",
+        176: "小雨",
+        179: "小雪",
+        182: "雨夹雪",
+        185: "雨夹雪",
+        200: "雷雨",
+        227: "暴风雪",
+        230: "暴风雪",
+        248: "雾",
+        260: "雾",
+        263: "小雨",
+        266: "小雨",
+        281: "雨夹雪",
+        284: "雨夹雪",
+        293: "小雨",
+        296: "小雨",
+        299: "中雨",
+        302: "中雨",
+        305: "大雨",
+        308: "大雨",
+        311: "大雨",
+        314: "大雨",
+        317: "中雪",
+        320: "中雪",
+        323: "小雪",
+        326: "小雪",
+        329: "中雪",
+        332: "中雪",
+        335: "大雪",
+        338: "大雪",
+        350: "冰雹",
+        353: "中雨",
+        356: "大雨",
+        359: "暴雨",
+        362: "中雪",
+        365: "大雪",
+        368: "小雪",
+        371: "大雪",
+        374: "冰雹",
+        377: "冰雹",
+        386: "雷雨",
+        389: "雷雨",
+        392: "雷雪",
+        395: "雷雪",
+    }
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.weather_data = {}
         self.location = "北京"
-        self._fetch_thread = None
+        self._fetching = False  # 是否有请求正在进行
+        self._nam = None  # 网络请求管理器（首次请求时创建）
         super().__init__(widget_id, "天气", size)
 
     def _setup_ui(self):
@@ -1848,21 +2678,9 @@ class WeatherWidget(BaseWidget):
         header_layout = QHBoxLayout()
 
         self.weather_icon = QLabel("N/A")
-        self.weather_icon.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 500;
-            color: {theme.accent};
-            background: transparent;
-        """)
         header_layout.addWidget(self.weather_icon)
 
         self.temp_label = QLabel("--°")
-        self.temp_label.setStyleSheet(f"""
-            color: {theme.text_primary};
-            font-size: 28px;
-            font-weight: 300;
-            background: transparent;
-        """)
         header_layout.addWidget(self.temp_label)
         header_layout.addStretch()
 
@@ -1870,20 +2688,10 @@ class WeatherWidget(BaseWidget):
 
         # 天气描述
         self.desc_label = QLabel("加载中...")
-        self.desc_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 13px;
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.desc_label)
 
         # 位置
         self.location_label = QLabel(self.location)
-        self.location_label.setStyleSheet(f"""
-            color: {theme.text_tertiary};
-            font-size: 11px;
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.location_label)
 
         # 详细信息
@@ -1891,119 +2699,122 @@ class WeatherWidget(BaseWidget):
         details_layout.setSpacing(16)
 
         self.humidity_label = QLabel("湿度 --%")
-        self.humidity_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 11px;
-            background: transparent;
-        """)
         details_layout.addWidget(self.humidity_label)
 
         self.wind_label = QLabel("风速 --km/h")
-        self.wind_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 11px;
-            background: transparent;
-        """)
         details_layout.addWidget(self.wind_label)
 
         details_layout.addStretch()
         self._main_layout.addLayout(details_layout)
+        self._apply_styles()
         self._main_layout.addStretch()
 
         # 定时更新天气
-        self.weather_timer = QTimer(self)
+        self.weather_timer = self._register_timer(QTimer(self))
         self.weather_timer.timeout.connect(self._start_fetch)
         self.weather_timer.start(300000)  # 每5分钟更新
 
         # 初始获取（异步）
         QTimer.singleShot(500, self._start_fetch)
 
+    def _load_cached_weather(self) -> bool:
+        """读取未过期的天气缓存，命中时直接更新显示"""
+        try:
+            cache = json.loads(WEATHER_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if cache.get("location") != self.location or time.time() - cache.get("ts", 0) >= WEATHER_CACHE_TTL:
+            return False
+        self.weather_data = cache.get("data", {})
+        self._update_display()
+        return True
+
+    def _save_cached_weather(self):
+        """写入天气缓存（先写临时文件再替换，避免写到一半的文件被读取）"""
+        try:
+            tmp_file = WEATHER_CACHE_FILE.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps({
+                "ts": time.time(),
+                "location": self.location,
+                "data": self.weather_data
+            }, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_file, WEATHER_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"保存天气缓存失败: {e}")
+
     def _start_fetch(self):
-        """异步获取天气数据"""
-        from threading import Thread
+        """异步获取天气数据（缓存未过期时不发起网络请求）"""
+        if self._load_cached_weather():
+            return
+        # 上一次请求尚未返回时不重复发起
+        if self._fetching:
+            return
+        self._fetching = True
+
+        # 由 Qt 事件循环异步完成请求，无需工作线程
+        if self._nam is None:
+            self._nam = QNetworkAccessManager(self)
+        url = f"https://wttr.in/{urllib.parse.quote(self.location)}?format=j1"
+        request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"User-Agent", b"curl")
+        request.setTransferTimeout(10000)
+        reply = self._nam.get(request)
+        reply.finished.connect(lambda: self._on_reply(reply))
+
+    def _on_reply(self, reply):
+        """天气接口返回"""
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise RuntimeError(reply.errorString())
+            weather_data = self._parse_weather(json.loads(bytes(reply.readAll()).decode('utf-8')))
+        except Exception as e:
+            self._on_weather_failed(e)
+        else:
+            self._on_weather_ready(weather_data)
+        finally:
+            reply.deleteLater()
+
+    @staticmethod
+    def _parse_weather(data):
+        """从接口数据中提取所需字段"""
+        current = data.get('current_condition', [{}])[0]
+        return {
+            'temp': current.get('temp_C', '--'),
+            'desc': current.get('weatherDesc', [{}])[0].get('value', '未知'),
+            'humidity': current.get('humidity', '--'),
+            'wind': current.get('windspeedKmph', '--'),
+            'code': current.get('weatherCode', '113')
+        }
 
-        def fetch():
-            try:
-                import urllib.request
-                import json
-
-                url = f"https://wttr.in/{urllib.parse.quote(self.location)}?format=j1"
-                req = urllib.request.Request(url, headers={'User-Agent': 'curl'})
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    data = json.loads(response.read().decode('utf-8'))
-
-                current = data.get('current_condition', [{}])[0]
-                self.weather_data = {
-                    'temp': current.get('temp_C', '--'),
-                    'desc': current.get('weatherDesc', [{}])[0].get('value', '未知'),
-                    'humidity': current.get('humidity', '--'),
-                    'wind': current.get('windspeedKmph', '--'),
-                    'code': current.get('weatherCode', '113')
-                }
-
-                # 在主线程更新UI
-                QTimer.singleShot(0, self._update_display)
-            except Exception as e:
-                QTimer.singleShot(0, lambda: self.desc_label.setText("获取失败"))
-                logger.error(f"获取天气失败: {e}")
+    def _on_weather_ready(self, weather_data):
+        """天气获取完成"""
+        self._fetching = False
+        self.weather_data = weather_data
+        self._save_cached_weather()
+        self._update_display()
 
-        thread = Thread(target=fetch, daemon=True)
-        thread.start()
+    def _on_weather_failed(self, error):
+        """天气获取失败"""
+        self._fetching = False
+        self.desc_label.setText("获取失败")
+        logger.error(f"获取天气失败: {error}")
 
     def _get_weather_text(self, code):
         """根据天气代码获取文字描述"""
-        code = int(code) if str(code).isdigit() else 113
-        texts = {
-            113: "晴",
-            116: "多云",
-            119: "阴",
-            122: "阴",
-            143: "雾",
-            176: "小雨",
-            179: "小雪",
-            182: "雨夹雪",
-            185: "雨夹雪",
-            200: "雷雨",
-            227: "暴风雪",
-            230: "暴风雪",
-            248: "雾",
-            260: "雾",
-            263: "小雨",
-            266: "小雨",
-            281: "雨夹雪",
-            284: "雨夹雪",
-            293: "小雨",
-            296: "小雨",
-            299: "中雨",
-            302: "中雨",
-            305: "大雨",
-            308: "大雨",
-            311: "大雨",
-            314: "大雨",
-            317: "中雪",
-            320: "中雪",
-            323: "小雪",
-            326: "小雪",
-            329: "中雪",
-            332: "中雪",
-            335: "大雪",
-            338: "大雪",
-            350: "冰雹",
-            353: "中雨",
-            356: "大雨",
-            359: "暴雨",
-            362: "中雪",
-            365: "大雪",
-            368: "小雪",
-            371: "大雪",
-            374: "冰雹",
-            377: "冰雹",
-            386: "雷雨",
-            389: "雷雨",
-            392: "雷雪",
-            395: "雷雪",
-        }
-        return texts.get(code, "未知")
+        try:
+            return self.WEATHER_TEXTS.get(int(code), "未知")
+        except (TypeError, ValueError):
+            return self.WEATHER_TEXTS[113]
+
+    def _apply_styles(self):
+        """应用样式"""
+        apply_style_sheet(self.weather_icon, theme.qss(self.WEATHER_ICON_QSS))
+        apply_style_sheet(self.temp_label, theme.qss(self.TEMP_LABEL_QSS))
+        apply_style_sheet(self.desc_label, theme.qss(self.DESC_LABEL_QSS))
+        apply_style_sheet(self.location_label, theme.qss(self.LOCATION_LABEL_QSS))
+        detail_style = theme.qss(self.DETAIL_LABEL_QSS)
+        apply_style_sheet(self.humidity_label, detail_style)
+        apply_style_sheet(self.wind_label, detail_style)
 
     def _update_display(self):
         """更新显示"""
@@ -2018,6 +2829,7 @@ class WeatherWidget(BaseWidget):
     def update_style(self):
         """更新样式"""
         super().update_style()
+        self._apply_styles()
 
     def update_content(self):
         pass
@@ -2025,44 +2837,20 @@ class WeatherWidget(BaseWidget):
 
 class TodoWidget(BaseWidget):
     """待办清单小组件"""
-    def __init__(self, widget_id: str, size: str = "medium"):
-        self.todos = []
-        self._load_todos()
-        super().__init__(widget_id, "待办", size)
-
-    def _load_todos(self):
-        """从配置加载待办"""
-        for w in config.widgets:
-            if w.get("id") == self.widget_id:
-                self.todos = w.get("todos", [])
-                break
-
-    def _setup_ui(self):
-        super()._setup_ui()
-
-        # 输入框
-        self.input = QLineEdit()
-        self.input.setPlaceholderText("添加新任务...")
-        self.input.returnPressed.connect(self._add_todo)
-        self.input.setStyleSheet(f"""
+    INPUT_QSS = """
             QLineEdit {{
-                background: {theme.bg_input};
-                border: 1px solid {theme.border};
+                background: {bg_input};
+                border: 1px solid {border};
                 border-radius: 6px;
                 padding: 8px 12px;
                 font-size: 12px;
-                color: {theme.text_primary};
+                color: {text_primary};
             }}
             QLineEdit:focus {{
-                border-color: {theme.accent};
+                border-color: {accent};
             }}
-        """)
-        self._main_layout.addWidget(self.input)
-
-        # 待办列表
-        self.list_widget = QListWidget()
-        self.list_widget.itemClicked.connect(self._toggle_todo)
-        self.list_widget.setStyleSheet(f"""
+        """
+    LIST_WIDGET_QSS = """
             QListWidget {{
                 background: transparent;
                 border: none;
@@ -2070,76 +2858,123 @@ class TodoWidget(BaseWidget):
             }}
             QListWidget::item {{
                 padding: 6px;
-                border-bottom: 1px solid {theme.border};
+                border-bottom: 1px solid {border};
             }}
             QListWidget::item:selected {{
-                background: {theme.bg_hover};
+                background: {bg_hover};
             }}
-        """)
-        self._main_layout.addWidget(self.list_widget)
-        self._update_list()
-
-        # 清除已完成按钮
-        self.clear_btn = QPushButton("清除已完成")
-        self.clear_btn.clicked.connect(self._clear_completed)
-        self.clear_btn.setStyleSheet(f"""
+        """
+    CLEAR_BTN_QSS = """
             QPushButton {{
                 background: transparent;
-                color: {theme.text_secondary};
+                color: {text_secondary};
                 border: none;
                 font-size: 11px;
                 padding: 4px;
             }}
             QPushButton:hover {{
-                color: {theme.accent};
+                color: {accent};
             }}
-        """)
+        """
+
+    def __init__(self, widget_id: str, size: str = "medium"):
+        self.todos = []
+        # 在基类初始化（会调用 _setup_ui 建列表）之前加载，此时 self.widget_id 尚未设置
+        self._load_todos(widget_id)
+        super().__init__(widget_id, "待办", size)
+
+    def _load_todos(self, widget_id: str):
+        """从配置加载待办"""
+        widget_config = config.get_widget(widget_id)
+        if widget_config is not None:
+            self.todos = widget_config.get("todos", [])
+
+    def _setup_ui(self):
+        super()._setup_ui()
+
+        # 输入框
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("添加新任务...")
+        self.input.returnPressed.connect(self._add_todo)
+        self._main_layout.addWidget(self.input)
+
+        # 待办列表
+        self.list_widget = QListWidget()
+        self.list_widget.itemClicked.connect(self._toggle_todo)
+        self._main_layout.addWidget(self.list_widget)
+        self._update_list()
+
+        # 清除已完成按钮
+        self.clear_btn = QPushButton("清除已完成")
+        self.clear_btn.clicked.connect(self._clear_completed)
         self._main_layout.addWidget(self.clear_btn)
+        self._apply_styles()
+
+    def _apply_styles(self):
+        """应用样式"""
+        apply_style_sheet(self.input, theme.qss(self.INPUT_QSS))
+        apply_style_sheet(self.list_widget, theme.qss(self.LIST_WIDGET_QSS))
+        apply_style_sheet(self.clear_btn, theme.qss(self.CLEAR_BTN_QSS))
 
     def _add_todo(self):
         """添加待办"""
         text = self.input.text().strip()
         if text:
-            self.todos.append({"text": text, "done": False})
+            todo = {"text": text, "done": False}
+            self.todos.append(todo)
             self.input.clear()
-            self._update_list()
+            self.list_widget.addItem(self._make_item(todo))
             self._save_todos()
 
+    def _make_item(self, todo) -> QListWidgetItem:
+        """创建待办列表项"""
+        item = QListWidgetItem()
+        self._apply_item_state(item, todo)
+        return item
+
+    def _apply_item_state(self, item, todo):
+        """按完成状态设置列表项文字和颜色"""
+        item.setText(f"{'✓ ' if todo['done'] else '○ '}{todo['text']}")
+        if todo['done']:
+            item.setForeground(QColor(theme.text_tertiary))
+        else:
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+
     def _update_list(self):
-        """更新列表显示"""
+        """重建列表显示（仅初始化时使用，增删改只更新对应的列表项）"""
         self.list_widget.clear()
-        for i, todo in enumerate(self.todos):
-            item = QListWidgetItem(f"{'✓ ' if todo['done'] else '○ '}{todo['text']}")
-            if todo['done']:
-                item.setForeground(QColor(theme.text_tertiary))
-            self.list_widget.addItem(item)
+        for todo in self.todos:
+            self.list_widget.addItem(self._make_item(todo))
 
     def _toggle_todo(self, item):
         """切换待办状态"""
         idx = self.list_widget.row(item)
         if 0 <= idx < len(self.todos):
-            self.todos[idx]['done'] = not self.todos[idx]['done']
-            self._update_list()
+            todo = self.todos[idx]
+            todo['done'] = not todo['done']
+            self._apply_item_state(item, todo)
             self._save_todos()
 
     def _clear_completed(self):
         """清除已完成"""
+        # 倒序移除，保证前面的行号不受影响
+        for idx in range(len(self.todos) - 1, -1, -1):
+            if self.todos[idx]['done']:
+                self.list_widget.takeItem(idx)
         self.todos = [t for t in self.todos if not t['done']]
-        self._update_list()
         self._save_todos()
 
     def _save_todos(self):
-        """保存待办"""
-        # 保存到配置
-        for w in config.widgets:
-            if w.get("id") == self.widget_id:
-                w["todos"] = self.todos
-                break
-        config.save()
+        """保存待办（延迟写盘，连续操作只写一次）"""
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["todos"] = self.todos
+        config.save_later(250)
 
     def update_style(self):
         """更新样式"""
         super().update_style()
+        self._apply_styles()
 
     def update_content(self):
         pass
@@ -2147,10 +2982,75 @@ class TodoWidget(BaseWidget):
 
 class AlarmWidget(BaseWidget):
     """倒计时小组件"""
+    DISPLAY_QSS = """
+            font-size: 36px;
+            font-weight: 200;
+            color: {text_primary};
+            background: transparent;
+            letter-spacing: 2px;
+        """
+    COLON_QSS = "color: {text_secondary}; font-size: 14px; background: transparent;"
+    SPIN_QSS = """
+            QSpinBox {{
+                background: {bg_input};
+                border: 1px solid {border};
+                border-radius: 8px;
+                padding: 6px 4px;
+                font-size: 13px;
+                color: {text_primary};
+                min-width: 36px;
+            }}
+            QSpinBox::up-button, QSpinBox::down-button {{
+                width: 16px;
+                background: transparent;
+            }}
+            QSpinBox:hover {{
+                border-color: {text_tertiary};
+            }}
+        """
+    # 优雅的按钮样式 - 使用边框而非填充色
+    BUTTON_QSS = """
+            QPushButton {{
+                background: transparent;
+                color: {text_primary};
+                border: 1px solid {border};
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-size: 12px;
+            }}
+            QPushButton:hover {{
+                background: {bg_hover};
+                border-color: {text_tertiary};
+            }}
+            QPushButton:pressed {{
+                background: {bg_pressed};
+            }}
+        """
+    # 主按钮样式 - 稍微突出但不刺眼
+    START_BUTTON_QSS = """
+            QPushButton {{
+                background: {bg_hover};
+                color: {text_primary};
+                border: 1px solid {border};
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-size: 12px;
+                font-weight: 500;
+            }}
+            QPushButton:hover {{
+                background: {bg_pressed};
+                border-color: {text_tertiary};
+            }}
+            QPushButton:pressed {{
+                background: {bg_card};
+            }}
+        """
+
     def __init__(self, widget_id: str, size: str = "medium"):
         self.target_time = None
         self.remaining_seconds = 0
         self.is_running = False
+        self._deadline = 0.0  # 运行中倒计时结束的 monotonic 时间
         super().__init__(widget_id, "倒计时", size)
 
     def _setup_ui(self):
@@ -2160,13 +3060,6 @@ class AlarmWidget(BaseWidget):
         self._main_layout.addStretch()
         self.display = QLabel("00:00:00")
         self.display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.display.setStyleSheet(f"""
-            font-size: 36px;
-            font-weight: 200;
-            color: {theme.text_primary};
-            background: transparent;
-            letter-spacing: 2px;
-        """)
         self._main_layout.addWidget(self.display)
         self._main_layout.addSpacing(12)
 
@@ -2182,9 +3075,8 @@ class AlarmWidget(BaseWidget):
         self.hour_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
         time_layout.addWidget(self.hour_spin)
 
-        colon1 = QLabel(":")
-        colon1.setStyleSheet(f"color: {theme.text_secondary}; font-size: 14px; background: transparent;")
-        time_layout.addWidget(colon1)
+        self._colon1 = QLabel(":")
+        time_layout.addWidget(self._colon1)
 
         self.min_spin = QSpinBox()
         self.min_spin.setRange(0, 59)
@@ -2192,9 +3084,8 @@ class AlarmWidget(BaseWidget):
         self.min_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
         time_layout.addWidget(self.min_spin)
 
-        colon2 = QLabel(":")
-        colon2.setStyleSheet(f"color: {theme.text_secondary}; font-size: 14px; background: transparent;")
-        time_layout.addWidget(colon2)
+        self._colon2 = QLabel(":")
+        time_layout.addWidget(self._colon2)
 
         self.sec_spin = QSpinBox()
         self.sec_spin.setRange(0, 59)
@@ -2220,79 +3111,28 @@ class AlarmWidget(BaseWidget):
         self._main_layout.addLayout(btn_layout)
         self._main_layout.addStretch()
 
-        # 定时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
+        # 定时器（隐藏时也要继续，保证到点提醒）
+        self._subscribe_tick(self._tick, pause_when_hidden=False)
 
         self._apply_styles()
 
     def _apply_styles(self):
         """应用样式 - 优雅简约风格"""
-        spin_style = f"""
-            QSpinBox {{
-                background: {theme.bg_input};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 6px 4px;
-                font-size: 13px;
-                color: {theme.text_primary};
-                min-width: 36px;
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                width: 16px;
-                background: transparent;
-            }}
-            QSpinBox:hover {{
-                border-color: {theme.text_tertiary};
-            }}
-        """
-        # 优雅的按钮样式 - 使用边框而非填充色
-        btn_style = f"""
-            QPushButton {{
-                background: transparent;
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background: {theme.bg_hover};
-                border-color: {theme.text_tertiary};
-            }}
-            QPushButton:pressed {{
-                background: {theme.bg_pressed};
-            }}
-        """
-        # 主按钮样式 - 稍微突出但不刺眼
-        start_btn_style = f"""
-            QPushButton {{
-                background: {theme.bg_hover};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background: {theme.bg_pressed};
-                border-color: {theme.text_tertiary};
-            }}
-            QPushButton:pressed {{
-                background: {theme.bg_card};
-            }}
-        """
-        self.hour_spin.setStyleSheet(spin_style)
-        self.min_spin.setStyleSheet(spin_style)
-        self.sec_spin.setStyleSheet(spin_style)
-        self.start_btn.setStyleSheet(start_btn_style)
-        self.reset_btn.setStyleSheet(btn_style)
+        spin_style = theme.qss(self.SPIN_QSS)
+        apply_style_sheet(self.hour_spin, spin_style)
+        apply_style_sheet(self.min_spin, spin_style)
+        apply_style_sheet(self.sec_spin, spin_style)
+        apply_style_sheet(self.start_btn, theme.qss(self.START_BUTTON_QSS))
+        apply_style_sheet(self.reset_btn, theme.qss(self.BUTTON_QSS))
+        apply_style_sheet(self.display, theme.qss(self.DISPLAY_QSS))
+        colon_style = theme.qss(self.COLON_QSS)
+        apply_style_sheet(self._colon1, colon_style)
+        apply_style_sheet(self._colon2, colon_style)
 
     def _toggle(self):
         """开始/暂停"""
         if self.is_running:
-            self.timer.stop()
+            self.remaining_seconds = self._seconds_left()
             self.is_running = False
             self.start_btn.setText("继续")
         else:
@@ -2301,28 +3141,33 @@ class AlarmWidget(BaseWidget):
                                          self.min_spin.value() * 60 +
                                          self.sec_spin.value())
             if self.remaining_seconds > 0:
-                self.timer.start(1000)
+                self._deadline = time.monotonic() + self.remaining_seconds
                 self.is_running = True
                 self.start_btn.setText("暂停")
 
+    def _seconds_left(self) -> int:
+        """距结束的剩余秒数（向上取整）"""
+        return max(0, math.ceil(self._deadline - time.monotonic()))
+
     def _reset(self):
         """重置"""
-        self.timer.stop()
         self.is_running = False
         self.remaining_seconds = 0
         self.start_btn.setText("开始")
         self.display.setText("00:00:00")
 
     def _tick(self):
-        """计时"""
-        if self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
-            h = self.remaining_seconds // 3600
-            m = (self.remaining_seconds % 3600) // 60
-            s = self.remaining_seconds % 60
-            self.display.setText(f"{h:02d}:{m:02d}:{s:02d}")
+        """计时（全局节拍驱动，按截止时间计算剩余秒数，不受节拍相位影响）"""
+        if not self.is_running:
+            return
+        remaining = self._seconds_left()
+        if remaining > 0:
+            if remaining != self.remaining_seconds:
+                self.remaining_seconds = remaining
+                self.display.setText(format_hms(remaining))
         else:
-            self.timer.stop()
+            self.remaining_seconds = 0
+            self.display.setText("00:00:00")
             self.is_running = False
             self.start_btn.setText("开始")
             # 播放提示音和弹窗
@@ -2331,20 +3176,18 @@ class AlarmWidget(BaseWidget):
     def _on_timer_end(self):
         """倒计时结束处理"""
         # 播放系统提示音
-        try:
-            import winsound
-            # 播放系统默认通知音
-            winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-        except:
-            pass
+        if winsound is not None:
+            try:
+                # 播放系统默认通知音
+                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+            except RuntimeError:
+                pass
 
         # 显示弹窗提示
         self._show_notification()
 
     def _show_notification(self):
         """显示倒计时结束通知"""
-        from PyQt6.QtWidgets import QMessageBox
-
         # 创建自定义消息框
         msg = QMessageBox(self)
         msg.setWindowTitle("倒计时结束")
@@ -2383,12 +3226,7 @@ class AlarmWidget(BaseWidget):
         msg.exec()
 
         # 让窗口闪烁提醒
-        try:
-            import ctypes
-            hwnd = int(self.winId())
-            ctypes.windll.user32.FlashWindow(hwnd, True)
-        except:
-            pass
+        _FlashWindow(self._get_hwnd(), True)
 
     def update_style(self):
         """更新样式"""
@@ -2399,15 +3237,54 @@ class AlarmWidget(BaseWidget):
         pass
 
 
-class WorldClockWidget(BaseWidget):
-    """世界时钟小组件"""
+class WorldClockWidget(BaseWidget):
+    """世界时钟小组件"""
+    CITY_COMBO_QSS = """
+            QComboBox {{
+                background: {bg_input};
+                border: 1px solid {border};
+                border-radius: 6px;
+                padding: 8px 12px;
+                font-size: 12px;
+                color: {text_primary};
+            }}
+            QComboBox::drop-down {{
+                border: none;
+            }}
+        """
+    TIME_LABEL_QSS = """
+            font-size: 32px;
+            font-weight: 300;
+            color: {text_primary};
+            background: transparent;
+        """
+    DATE_LABEL_QSS = """
+            font-size: 12px;
+            color: {text_secondary};
+            background: transparent;
+        """
+    DIFF_LABEL_QSS = """
+            font-size: 11px;
+            color: {text_tertiary};
+            background: transparent;
+        """
+
     TIMEZONES = {
         "北京": 8, "东京": 9, "纽约": -5, "伦敦": 0, "巴黎": 1,
         "悉尼": 11, "迪拜": 4, "莫斯科": 3, "新加坡": 8, "洛杉矶": -8
     }
+    # 城市对应的 IANA 时区（含夏令时规则），缺少时区数据时退回上面的固定偏移
+    TIMEZONE_NAMES = {
+        "北京": "Asia/Shanghai", "东京": "Asia/Tokyo", "纽约": "America/New_York",
+        "伦敦": "Europe/London", "巴黎": "Europe/Paris", "悉尼": "Australia/Sydney",
+        "迪拜": "Asia/Dubai", "莫斯科": "Europe/Moscow", "新加坡": "Asia/Singapore",
+        "洛杉矶": "America/Los_Angeles"
+    }
+    _zones: dict = {}
 
     def __init__(self, widget_id: str, size: str = "medium"):
         self.selected_city = "纽约"
+        self._last_minute = -1  # 上次刷新日期和时差时的分钟
         super().__init__(widget_id, "世界时钟", size)
 
     def _setup_ui(self):
@@ -2418,89 +3295,81 @@ class WorldClockWidget(BaseWidget):
         self.city_combo.addItems(list(self.TIMEZONES.keys()))
         self.city_combo.setCurrentText(self.selected_city)
         self.city_combo.currentTextChanged.connect(self._on_city_changed)
-        self.city_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {theme.bg_input};
-                border: 1px solid {theme.border};
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-                color: {theme.text_primary};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-        """)
         self._main_layout.addWidget(self.city_combo)
 
         # 时间显示
         self.time_label = QLabel("--:--:--")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.time_label.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: 300;
-            color: {theme.text_primary};
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.time_label)
 
         # 日期显示
         self.date_label = QLabel("")
         self.date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.date_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {theme.text_secondary};
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.date_label)
 
         # 时差显示
         self.diff_label = QLabel("")
         self.diff_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.diff_label.setStyleSheet(f"""
-            font-size: 11px;
-            color: {theme.text_tertiary};
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.diff_label)
         self._main_layout.addStretch()
+        self._apply_styles()
 
         # 更新定时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_time)
-        self.timer.start(1000)
+        self._subscribe_tick(self._update_time)
         self._update_time()
 
+    def _apply_styles(self):
+        """应用样式"""
+        apply_style_sheet(self.city_combo, theme.qss(self.CITY_COMBO_QSS))
+        apply_style_sheet(self.time_label, theme.qss(self.TIME_LABEL_QSS))
+        apply_style_sheet(self.date_label, theme.qss(self.DATE_LABEL_QSS))
+        apply_style_sheet(self.diff_label, theme.qss(self.DIFF_LABEL_QSS))
+
     def _on_city_changed(self, city):
         """城市改变"""
         self.selected_city = city
+        self._last_minute = -1
         self._update_time()
 
+    @classmethod
+    def _get_zone(cls, city):
+        """获取城市时区（首次使用时创建并缓存）"""
+        zone = cls._zones.get(city)
+        if zone is None:
+            try:
+                zone = ZoneInfo(cls.TIMEZONE_NAMES[city])
+            except (KeyError, ZoneInfoNotFoundError):
+                zone = timezone(timedelta(hours=cls.TIMEZONES.get(city, 0)))
+            cls._zones[city] = zone
+        return zone
+
     def _update_time(self):
         """更新时间"""
-        from datetime import datetime, timedelta
-        import time
+        utc_now = datetime.now(timezone.utc)
+        local_time = utc_now.astimezone()
+        target_time = utc_now.astimezone(self._get_zone(self.selected_city))
 
-        utc_now = datetime.utcnow()
-        target_offset = self.TIMEZONES.get(self.selected_city, 0)
-        target_time = utc_now + timedelta(hours=target_offset)
+        self.time_label.setText(f"{target_time:%H:%M:%S}")
 
-        self.time_label.setText(target_time.strftime("%H:%M:%S"))
-        self.date_label.setText(target_time.strftime("%Y年%m月%d日 %A"))
+        # 日期和时差最多每分钟变化一次（夏令时切换也在整分钟）
+        if target_time.minute == self._last_minute:
+            return
+        self._last_minute = target_time.minute
+        self.date_label.setText(f"{target_time:%Y年%m月%d日 %A}")
 
-        # 计算时差
-        local_offset = time.timezone // -3600  # 本地时区偏移
-        diff = target_offset - local_offset
+        # 计算时差（两地当前的 UTC 偏移之差，已计入夏令时）
+        diff = (target_time.utcoffset() - local_time.utcoffset()).total_seconds() / 3600
         if diff == 0:
             self.diff_label.setText("与本地时间相同")
         elif diff > 0:
-            self.diff_label.setText(f"比本地快 {diff} 小时")
+            self.diff_label.setText(f"比本地快 {diff:g} 小时")
         else:
-            self.diff_label.setText(f"比本地慢 {abs(diff)} 小时")
+            self.diff_label.setText(f"比本地慢 {abs(diff):g} 小时")
 
     def update_style(self):
         """更新样式"""
         super().update_style()
+        self._apply_styles()
 
     def update_content(self):
         pass
@@ -2508,9 +3377,34 @@ class WorldClockWidget(BaseWidget):
 
 class NetworkMonitorWidget(BaseWidget):
     """网络速度监控小组件"""
+    DOWNLOAD_LABEL_QSS = """
+            color: {accent};
+            font-size: 14px;
+            font-weight: 500;
+            background: transparent;
+        """
+    UPLOAD_LABEL_QSS = """
+            color: {success};
+            font-size: 14px;
+            font-weight: 500;
+            background: transparent;
+        """
+    DISK_LABEL_QSS = """
+            color: {text_secondary};
+            font-size: 11px;
+            background: transparent;
+        """
+
+    # 磁盘占用每隔几次刷新读取一次
+    DISK_INTERVAL = 5
+
     def __init__(self, widget_id: str, size: str = "medium"):
-        self.last_bytes_sent = 0
-        self.last_bytes_recv = 0
+        # 磁盘占用变化很慢，无需每秒读取
+        self._disk_counter = 0
+        self._last_disk_text = None
+        # 上次显示的速度文字，未变化时跳过 setText
+        self._last_down_text = None
+        self._last_up_text = None
         super().__init__(widget_id, "网络监控", size)
 
     def _setup_ui(self):
@@ -2518,82 +3412,93 @@ class NetworkMonitorWidget(BaseWidget):
 
         # 下载速度
         self.download_label = QLabel("↓ 0 KB/s")
-        self.download_label.setStyleSheet(f"""
-            color: {theme.accent};
-            font-size: 14px;
-            font-weight: 500;
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.download_label)
 
         # 上传速度
         self.upload_label = QLabel("↑ 0 KB/s")
-        self.upload_label.setStyleSheet(f"""
-            color: {theme.success};
-            font-size: 14px;
-            font-weight: 500;
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.upload_label)
 
         self._main_layout.addSpacing(8)
 
         # 磁盘使用率
         self.disk_label = QLabel("磁盘: --")
-        self.disk_label.setStyleSheet(f"""
-            color: {theme.text_secondary};
-            font-size: 11px;
-            background: transparent;
-        """)
         self._main_layout.addWidget(self.disk_label)
 
         self._main_layout.addStretch()
+        self._apply_styles()
 
-        # 初始化网络计数
-        net = psutil.net_io_counters()
-        self.last_bytes_sent = net.bytes_sent
-        self.last_bytes_recv = net.bytes_recv
+        # 网络计数由全局采样器统一读取，多个组件共享同一次采样
+        NetSampler.instance().sampled.connect(self._update_stats)
+        self._update_stats(0, 0)
 
-        # 更新定时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_stats)
-        self.timer.start(1000)
-        self._update_stats()
+    def _apply_styles(self):
+        """应用样式"""
+        apply_style_sheet(self.download_label, theme.qss(self.DOWNLOAD_LABEL_QSS))
+        apply_style_sheet(self.upload_label, theme.qss(self.UPLOAD_LABEL_QSS))
+        apply_style_sheet(self.disk_label, theme.qss(self.DISK_LABEL_QSS))
 
-    def _format_speed(self, bytes_per_sec):
+    @staticmethod
+    def _format_speed(bytes_per_sec):
         """格式化速度"""
+        if bytes_per_sec == 0:
+            return "0 B/s"
         if bytes_per_sec < 1024:
             return f"{bytes_per_sec:.0f} B/s"
-        elif bytes_per_sec < 1024 * 1024:
+        elif bytes_per_sec < 1 << 20:
             return f"{bytes_per_sec / 1024:.1f} KB/s"
         else:
-            return f"{bytes_per_sec / 1024 / 1024:.1f} MB/s"
+            return f"{bytes_per_sec / (1 << 20):.1f} MB/s"
 
-    def _update_stats(self):
+    def _update_stats(self, download_speed, upload_speed):
         """更新统计"""
         # 网络速度
-        net = psutil.net_io_counters()
-        download_speed = net.bytes_recv - self.last_bytes_recv
-        upload_speed = net.bytes_sent - self.last_bytes_sent
-        self.last_bytes_recv = net.bytes_recv
-        self.last_bytes_sent = net.bytes_sent
-
-        self.download_label.setText(f"↓ {self._format_speed(download_speed)}")
-        self.upload_label.setText(f"↑ {self._format_speed(upload_speed)}")
+        down_text = self._format_speed(download_speed)
+        if down_text != self._last_down_text:
+            self._last_down_text = down_text
+            self.download_label.setText(f"↓ {down_text}")
+        up_text = self._format_speed(upload_speed)
+        if up_text != self._last_up_text:
+            self._last_up_text = up_text
+            self.upload_label.setText(f"↑ {up_text}")
 
         # 磁盘使用率
+        self._disk_counter = (self._disk_counter + 1) % self.DISK_INTERVAL
+        if self._disk_counter != 1:
+            return
         try:
             disk = psutil.disk_usage('C:')
             used_gb = disk.used / (1024 ** 3)
             total_gb = disk.total / (1024 ** 3)
             percent = disk.percent
-            self.disk_label.setText(f"磁盘 C: {used_gb:.0f}/{total_gb:.0f} GB ({percent}%)")
-        except:
+            text = f"磁盘 C: {used_gb:.0f}/{total_gb:.0f} GB ({percent}%)"
+            if text != self._last_disk_text:
+                self._last_disk_text = text
+                self.disk_label.setText(text)
+        except OSError:
+            pass
+
+    def _pause_updates(self):
+        super()._pause_updates()
+        try:
+            NetSampler.instance().sampled.disconnect(self._update_stats)
+        except TypeError:
+            pass
+
+    def _resume_updates(self):
+        super()._resume_updates()
+        NetSampler.instance().sampled.connect(self._update_stats)
+
+    def closeEvent(self, event):
+        try:
+            NetSampler.instance().sampled.disconnect(self._update_stats)
+        except TypeError:
             pass
+        super().closeEvent(event)
 
     def update_style(self):
         """更新样式"""
         super().update_style()
+        self._apply_styles()
 
     def update_content(self):
         pass
@@ -2605,13 +3510,84 @@ class ImageWidget(BaseWidget):
         self.image_path = ""
         self.crop_rect = None  # 裁剪区域 (x, y, width, height)
         self.filter_type = "none"  # none, grayscale, sepia, blur
+        # 当前图片的原图（自己持有引用，大图超出 QPixmapCache 容量时也不会反复解码）
+        self._source_pixmap = None
+        self._source_path = None
+        # 处理后的图片缓存（路径、裁剪、尺寸、滤镜变化时重新生成）
+        self._scaled_pixmap = None
+        self._pixmap_key = None
+        # 未加滤镜的缩放结果及其各滤镜版本，仅切换滤镜时直接复用
+        self._base_pixmap = None
+        self._base_key = None
+        self._filtered_pixmaps = {}
         super().__init__(widget_id, "图片", size)
 
     def _setup_ui(self):
         super()._setup_ui()
         # 不添加任何按钮，保持空白界面
         self._main_layout.addStretch()
-        
+        self._placeholder_font = QFont()
+        self._placeholder_font.setPointSize(10)
+        self._update_placeholder_style()
+
+    def _update_placeholder_style(self):
+        """按当前主题生成水印提示的画笔（切换主题时重建，绘制时直接复用）"""
+        color = QColor(theme.text_tertiary)
+        self._placeholder_pen = QPen(color, 2)
+        self._placeholder_text_pen = QPen(color)
+
+    def update_style(self):
+        """更新样式"""
+        super().update_style()
+        self._update_placeholder_style()
+        self.update()
+
+    def _placeholder_pixmap(self) -> QPixmap:
+        """水印提示（图标 + 文字）预渲染为一张图，按主题颜色和设备像素比缓存，所有空白图片组件共用"""
+        dpr = self.devicePixelRatioF()
+        key = f"image_placeholder:{theme.text_tertiary}:{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        # 布局：图标在上，文字在下，四周留出画笔宽度的边距
+        icon_size = 40
+        text_height = 20
+        pad = 2
+        text = "右键添加图片"
+        text_width = QFontMetrics(self._placeholder_font).horizontalAdvance(text)
+        width = max(icon_size, text_width) + pad * 2
+        height = icon_size + 10 + text_height + pad * 2
+
+        pixmap = QPixmap(math.ceil(width * dpr), math.ceil(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 绘制图片图标
+        icon_rect = QRect((width - icon_size) // 2, pad, icon_size, icon_size)
+        painter.setPen(self._placeholder_pen)
+        painter.drawRect(icon_rect)
+        # 绘制山形
+        painter.drawLine(icon_rect.left() + 5, icon_rect.bottom() - 10,
+                         icon_rect.center().x(), icon_rect.top() + 15)
+        painter.drawLine(icon_rect.center().x(), icon_rect.top() + 15,
+                         icon_rect.right() - 5, icon_rect.bottom() - 10)
+        # 绘制太阳
+        painter.drawEllipse(icon_rect.topLeft() + QPoint(8, 8), 5, 5)
+
+        # 绘制提示文字（在图标下方）
+        painter.setFont(self._placeholder_font)
+        painter.setPen(self._placeholder_text_pen)
+        text_rect = QRect(0, pad + icon_size + 10, width, text_height)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, text)
+        painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def _get_widget_ratio(self) -> float:
         """获取小组件的宽高比（使用实际窗口大小）"""
         # 使用实际内容区域大小（支持拖拽调整大小）
@@ -2634,7 +3610,9 @@ class ImageWidget(BaseWidget):
             pixmap = QPixmap(file_path)
             if pixmap.isNull():
                 return
-                
+            # 刚解码的原图直接放入缓存，绘制时不再重复读取文件（同时刷新同路径的旧缓存）
+            QPixmapCache.insert(f"image:{file_path}", pixmap)
+
             # 计算图片和小组件的比例
             img_ratio = pixmap.width() / pixmap.height()
             widget_ratio = self._get_widget_ratio()
@@ -2654,35 +3632,42 @@ class ImageWidget(BaseWidget):
                 # 比例匹配，直接使用
                 self.image_path = file_path
                 self.crop_rect = None
-                
+
+            self._source_pixmap = pixmap
+            self._source_path = file_path
             self.update()
 
             # 保存配置
-            for widget_config in config.widgets:
-                if widget_config.get("id") == self.widget_id:
-                    widget_config["image_path"] = self.image_path
-                    if self.crop_rect:
-                        widget_config["crop_rect"] = [
-                            self.crop_rect.x(), self.crop_rect.y(),
-                            self.crop_rect.width(), self.crop_rect.height()
-                        ]
-                    else:
-                        widget_config["crop_rect"] = None
-                    break
+            widget_config = config.get_widget(self.widget_id)
+            if widget_config is not None:
+                widget_config["image_path"] = self.image_path
+                if self.crop_rect:
+                    widget_config["crop_rect"] = [
+                        self.crop_rect.x(), self.crop_rect.y(),
+                        self.crop_rect.width(), self.crop_rect.height()
+                    ]
+                else:
+                    widget_config["crop_rect"] = None
             config.save()
 
     def _clear_image(self):
         """清除图片"""
         self.image_path = ""
         self.crop_rect = None
+        self._source_pixmap = None
+        self._source_path = None
+        self._scaled_pixmap = None
+        self._pixmap_key = None
+        self._base_pixmap = None
+        self._base_key = None
+        self._filtered_pixmaps.clear()
         self.update()
 
         # 保存配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["image_path"] = ""
-                widget_config["crop_rect"] = None
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["image_path"] = ""
+            widget_config["crop_rect"] = None
         config.save()
 
     def paintEvent(self, event):
@@ -2692,7 +3677,6 @@ class ImageWidget(BaseWidget):
 
         m = self.SHADOW_MARGIN
         content_rect = QRect(m, m, self.width() - m * 2, self.height() - m * 2)
-        corner_radius = 16  # 圆角半径
 
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -2700,150 +3684,125 @@ class ImageWidget(BaseWidget):
 
         if self.image_path:
             # 有图片，绘制图片背景（带圆角）
-            pixmap = QPixmap(self.image_path)
-            if not pixmap.isNull():
-                # 创建圆角矩形路径作为裁剪区域
-                from PyQt6.QtGui import QPainterPath
-                clip_path = QPainterPath()
-                clip_path.addRoundedRect(content_rect.x(), content_rect.y(), 
-                                          content_rect.width(), content_rect.height(),
-                                          corner_radius, corner_radius)
-                painter.setClipPath(clip_path)
-
-                if self.crop_rect:
-                    # 使用裁剪区域绘制
-                    cropped = pixmap.copy(self.crop_rect)
-                    scaled_pixmap = cropped.scaled(
-                        content_rect.size(),
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                else:
-                    # 无裁剪区域，按比例缩放填充
-                    scaled_pixmap = pixmap.scaled(
-                        content_rect.size(),
-                        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-
-                # 应用滤镜
-                if self.filter_type != "none":
-                    scaled_pixmap = self._apply_filter(scaled_pixmap)
-
+            scaled_pixmap = self._get_scaled_pixmap(content_rect.size())
+            if scaled_pixmap is not None:
+                # 复用基类的圆角路径作为裁剪区域
+                painter.setClipPath(self._content_path)
                 painter.drawPixmap(content_rect, scaled_pixmap, scaled_pixmap.rect())
         else:
-            # 没有图片，绘制水印提示
+            # 没有图片，绘制预渲染的水印提示（整体居中）
             painter.setClipRect(content_rect)
+            placeholder = self._placeholder_pixmap()
+            size = placeholder.deviceIndependentSize()
+            # 取整对齐像素，避免位图被插值模糊
+            painter.drawPixmap(QPoint(round(content_rect.center().x() - size.width() / 2),
+                                      round(content_rect.center().y() - size.height() / 2)), placeholder)
 
-            # 计算整体布局（图标 + 文字）
-            icon_size = 40
-            text_height = 20
-            total_height = icon_size + 10 + text_height
-
-            # 计算起始位置（整体垂直居中）
-            start_y = content_rect.center().y() - total_height // 2
-
-            # 绘制图片图标
-            icon_rect = QRect(
-                content_rect.center().x() - icon_size // 2,
-                start_y,
-                icon_size,
-                icon_size
-            )
+        painter.end()
 
-            painter.setPen(QPen(QColor(theme.text_tertiary), 2))
-            painter.drawRect(icon_rect)
-            # 绘制山形
-            painter.drawLine(icon_rect.left() + 5, icon_rect.bottom() - 10,
-                           icon_rect.center().x(), icon_rect.top() + 15)
-            painter.drawLine(icon_rect.center().x(), icon_rect.top() + 15,
-                           icon_rect.right() - 5, icon_rect.bottom() - 10)
-            # 绘制太阳
-            painter.drawEllipse(icon_rect.topLeft() + QPoint(8, 8), 5, 5)
-
-            # 绘制提示文字（在图标下方）
-            font = QFont()
-            font.setPointSize(10)
-            painter.setFont(font)
-            painter.setPen(QColor(theme.text_tertiary))
-            text_rect = QRect(
-                content_rect.left(),
-                start_y + icon_size + 10,
-                content_rect.width(),
-                text_height
-            )
-            painter.drawText(
-                text_rect,
-                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
-                "右键添加图片"
+    def _load_source_pixmap(self) -> QPixmap:
+        """加载原图（优先用自己持有的原图，其次通过 QPixmapCache 共享，避免重复读取文件）"""
+        if self._source_path == self.image_path and self._source_pixmap is not None:
+            return self._source_pixmap
+        key = f"image:{self.image_path}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.image_path)
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        if not pixmap.isNull():
+            self._source_pixmap = pixmap
+            self._source_path = self.image_path
+        return pixmap
+
+    def _get_scaled_pixmap(self, size: QSize):
+        """获取裁剪、缩放并应用滤镜后的图片（参数不变时复用上次结果）"""
+        # 按设备像素比缩放，高分屏上绘制时无需再放大
+        size = size * self.devicePixelRatioF()
+        crop = self.crop_rect.getRect() if self.crop_rect else None
+        base_key = (self.image_path, crop, size.width(), size.height())
+        key = base_key + (self.filter_type,)
+        if key == self._pixmap_key:
+            return self._scaled_pixmap
+        # 同一张图片只是换了滤镜或尺寸时，新滤镜完成前可继续显示当前画面
+        same_image = self._pixmap_key is not None and self._pixmap_key[0] == self.image_path
+
+        if base_key != self._base_key:
+            pixmap = self._load_source_pixmap()
+            if pixmap.isNull():
+                self._base_pixmap = None
+            elif self.crop_rect:
+                # 使用裁剪区域绘制
+                self._base_pixmap = pixmap.copy(self.crop_rect).scaled(
+                    size,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            else:
+                # 无裁剪区域，按比例缩放填充
+                self._base_pixmap = pixmap.scaled(
+                    size,
+                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            self._base_key = base_key
+            self._filtered_pixmaps.clear()
+
+        self._pixmap_key = key
+        filtered = self._filtered_pixmaps.get(self.filter_type)
+        if filtered is not None:
+            self._scaled_pixmap = filtered
+            return filtered
+
+        scaled_pixmap = self._base_pixmap
+
+        # 滤镜在线程池中处理，完成前保留当前画面（换了图片或首次显示时先显示未加滤镜的图片）
+        if scaled_pixmap is not None and self.filter_type != "none":
+            self.run_in_background(
+                apply_image_filter, lambda image, k=key: self._on_filter_done(k, image),
+                scaled_pixmap.toImage(), self.filter_type
             )
+            if same_image and self._scaled_pixmap is not None:
+                return self._scaled_pixmap
+        self._scaled_pixmap = scaled_pixmap
+        return scaled_pixmap
+
+    def _on_filter_done(self, key, image):
+        """滤镜处理完成（期间参数已变化则丢弃结果）"""
+        if key != self._pixmap_key:
+            return
+        self._scaled_pixmap = QPixmap.fromImage(image)
+        self._filtered_pixmaps[key[-1]] = self._scaled_pixmap
+        self.update()
 
-        painter.end()
-
-    def contextMenuEvent(self, event):
+    def _build_context_menu(self, menu: QMenu):
         """右键菜单"""
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 6px 4px;
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-            }}
-            QMenu::item {{
-                padding: 8px 28px 8px 16px;
-                border-radius: 4px;
-                background: transparent;
-                color: {theme.text_primary};
-                margin: 1px 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.bg_hover};
-            }}
-            QMenu::item:pressed {{
-                background-color: {theme.bg_pressed};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme.border};
-                margin: 4px 12px;
-            }}
-        """)
-
         # 选择图片
         select_action = menu.addAction("选择图片")
         select_action.triggered.connect(self._select_image)
 
         # 清除图片（仅在已有图片时显示）
-        if self.image_path:
-            clear_action = menu.addAction("清除图片")
-            clear_action.triggered.connect(self._clear_image)
-
-        menu.addSeparator()
-
-        # 鼠标穿透选项
-        click_through_action = menu.addAction("鼠标穿透")
-        click_through_action.setCheckable(True)
-        click_through_action.setChecked(self.click_through)
-        click_through_action.triggered.connect(self._toggle_click_through)
-
-        menu.addSeparator()
-
-        # 窗口层级选项
-        top_action = menu.addAction("置顶显示")
-        top_action.triggered.connect(self._bring_to_top)
+        self._clear_image_action = menu.addAction("清除图片")
+        self._clear_image_action.triggered.connect(self._clear_image)
 
-        bottom_action = menu.addAction("置底显示")
-        bottom_action.triggered.connect(self._send_to_bottom)
+        # 滤镜子菜单
+        filter_menu = menu.addMenu("滤镜效果")
+        self._filter_actions = {}
+        filters = [("无", "none"), ("灰度", "grayscale"), ("复古", "sepia"), ("反色", "invert")]
+        for name, ftype in filters:
+            action = filter_menu.addAction(name)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, f=ftype: self._set_filter(f))
+            self._filter_actions[ftype] = action
 
         menu.addSeparator()
+        super()._build_context_menu(menu)
 
-        close_action = menu.addAction("关闭小组件")
-        close_action.triggered.connect(self._on_close)
-
-        menu.exec(event.globalPos())
+    def _update_context_menu(self):
+        super()._update_context_menu()
+        self._clear_image_action.setVisible(bool(self.image_path))
+        for ftype, action in self._filter_actions.items():
+            action.setChecked(self.filter_type == ftype)
 
     def update_content(self):
         pass
@@ -2857,68 +3816,26 @@ class ImageWidget(BaseWidget):
             # 获取新的宽高比
             new_ratio = self._get_widget_ratio()
 
-            # 加载原始图片
-            pixmap = QPixmap(self.image_path)
+            # 原图已在内存中持有，拖拽调整大小时不会重新解码
+            pixmap = self._load_source_pixmap()
             if pixmap.isNull():
                 return
 
-            # 计算新的裁剪区域（保持居中）
-            img_w = pixmap.width()
-            img_h = pixmap.height()
-            img_ratio = img_w / img_h
-
-            if new_ratio > img_ratio:
-                # 新窗口更宽，裁剪高度
-                crop_h = int(img_w / new_ratio)
-                crop_w = img_w
-                crop_x = 0
-                crop_y = (img_h - crop_h) // 2
-            else:
-                # 新窗口更高，裁剪宽度
-                crop_w = int(img_h * new_ratio)
-                crop_h = img_h
-                crop_x = (img_w - crop_w) // 2
-                crop_y = 0
-
-            self.crop_rect = QRect(crop_x, crop_y, crop_w, crop_h)
+            # 计算新的裁剪区域（保持居中），没有变化时不重绘也不保存
+            crop_rect = center_crop_rect(pixmap.width(), pixmap.height(), new_ratio)
+            if crop_rect == self.crop_rect:
+                return
+            self.crop_rect = crop_rect
             self.update()
 
-            # 保存新的裁剪区域
-            for widget_config in config.widgets:
-                if widget_config.get("id") == self.widget_id:
-                    widget_config["crop_rect"] = [
-                        self.crop_rect.x(), self.crop_rect.y(),
-                        self.crop_rect.width(), self.crop_rect.height()
-                    ]
-                    break
-            config.save()
-
-    def _apply_filter(self, pixmap):
-        """应用滤镜效果"""
-        from PyQt6.QtGui import QImage
-
-        img = pixmap.toImage()
-        result = QImage(img.size(), QImage.Format.Format_ARGB32)
-
-        for y in range(img.height()):
-            for x in range(img.width()):
-                color = img.pixelColor(x, y)
-                r, g, b = color.red(), color.green(), color.blue()
-
-                if self.filter_type == "grayscale":
-                    gray = int(0.299 * r + 0.587 * g + 0.114 * b)
-                    color = QColor(gray, gray, gray, color.alpha())
-                elif self.filter_type == "sepia":
-                    nr = min(255, int(0.393 * r + 0.769 * g + 0.189 * b))
-                    ng = min(255, int(0.349 * r + 0.686 * g + 0.168 * b))
-                    nb = min(255, int(0.272 * r + 0.534 * g + 0.131 * b))
-                    color = QColor(nr, ng, nb, color.alpha())
-                elif self.filter_type == "invert":
-                    color = QColor(255 - r, 255 - g, 255 - b, color.alpha())
-
-                result.setPixelColor(x, y, color)
-
-        return QPixmap.fromImage(result)
+            # 保存新的裁剪区域（拖拽调整大小时合并为一次写入）
+            widget_config = config.get_widget(self.widget_id)
+            if widget_config is not None:
+                widget_config["crop_rect"] = [
+                    self.crop_rect.x(), self.crop_rect.y(),
+                    self.crop_rect.width(), self.crop_rect.height()
+                ]
+            config.save_later()
 
     def _set_filter(self, filter_type):
         """设置滤镜"""
@@ -2926,45 +3843,58 @@ class ImageWidget(BaseWidget):
         self.update()
 
         # 保存配置
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                widget_config["filter_type"] = filter_type
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            widget_config["filter_type"] = filter_type
         config.save()
 
-    def _get_context_menu(self):
-        """获取右键菜单"""
-        menu = super()._get_context_menu()
-        menu.addSeparator()
-
-        # 滤镜子菜单
-        filter_menu = menu.addMenu("滤镜效果")
-        filters = [("无", "none"), ("灰度", "grayscale"), ("复古", "sepia"), ("反色", "invert")]
-        for name, ftype in filters:
-            action = filter_menu.addAction(name)
-            action.setCheckable(True)
-            action.setChecked(self.filter_type == ftype)
-            action.triggered.connect(lambda checked, f=ftype: self._set_filter(f))
-
-        return menu
-
     def _load_config(self):
         """从配置加载"""
-        for widget_config in config.widgets:
-            if widget_config.get("id") == self.widget_id:
-                self.image_path = widget_config.get("image_path", "")
-                self.filter_type = widget_config.get("filter_type", "none")
-                crop = widget_config.get("crop_rect")
-                if crop:
-                    self.crop_rect = QRect(crop[0], crop[1], crop[2], crop[3])
-                break
+        widget_config = config.get_widget(self.widget_id)
+        if widget_config is not None:
+            self.image_path = widget_config.get("image_path", "")
+            self.filter_type = widget_config.get("filter_type", "none")
+            crop = widget_config.get("crop_rect")
+            if crop:
+                self.crop_rect = QRect(crop[0], crop[1], crop[2], crop[3])
 
 
 if WEBENGINE_AVAILABLE:
     class WebWidget(BaseWidget):
         """网页小组件 - 显示网页内容"""
+        # 未加载网址时显示的占位页面模板
+        PLACEHOLDER_HTML = """
+            <html>
+            <head>
+                <style>
+                    body {{
+                        display: flex;
+                        flex-direction: column;
+                        justify-content: center;
+                        align-items: center;
+                        height: 100vh;
+                        margin: 0;
+                        background-color: {bg_card};
+                        font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
+                        color: {text_secondary};
+                    }}
+                    .hint {{
+                        font-size: 14px;
+                        opacity: 0.7;
+                    }}
+                </style>
+            </head>
+            <body>
+                <div class="hint">在上方输入网址开始浏览</div>
+            </body>
+            </html>
+            """
+
         def __init__(self, widget_id: str, size: str = "xlarge"):
+            if not _ensure_webengine():
+                raise RuntimeError("WebEngine 不可用")
             self.url = ""
+            self._placeholder_shown = False
             self.web_view = None
             self.url_input = None
             self.control_bar = None
@@ -3047,44 +3977,49 @@ if WEBENGINE_AVAILABLE:
             # 访问按钮
             self.go_btn = QPushButton("访问")
             self.go_btn.clicked.connect(self._load_url)
-            control_layout.addWidget(self.go_btn)
-
-            # 添加到布局
-            self._main_layout.addWidget(self.control_bar)
-            self._main_layout.addWidget(self.web_view, 1)
-
-            # 默认显示提示页面
-            self._show_placeholder()
-
-        def _show_placeholder(self):
-            """显示占位页面"""
-            html = f"""
-            <html>
-            <head>
-                <style>
-                    body {{
-                        display: flex;
-                        flex-direction: column;
-                        justify-content: center;
-                        align-items: center;
-                        height: 100vh;
-                        margin: 0;
-                        background-color: {theme.bg_card};
-                        font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                        color: {theme.text_secondary};
-                    }}
-                    .hint {{
-                        font-size: 14px;
-                        opacity: 0.7;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="hint">在上方输入网址开始浏览</div>
-            </body>
-            </html>
-            """
-            self.web_view.setHtml(html)
+            control_layout.addWidget(self.go_btn)
+
+            # 添加到布局
+            self._main_layout.addWidget(self.control_bar)
+            self._main_layout.addWidget(self.web_view, 1)
+
+            # 缩放延迟到调整大小停下后再应用，避免拖拽中网页反复重新布局
+            self._zoom_timer = QTimer(self)
+            self._zoom_timer.setSingleShot(True)
+            self._zoom_timer.setInterval(120)
+            self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        def showEvent(self, event):
+            super().showEvent(event)
+            # 首次显示时仍未加载网址才生成提示页面（恢复的组件会直接加载网址）
+            if not self._placeholder_shown and not self.url:
+                self._placeholder_shown = True
+                self._show_placeholder()
+
+        def load_url_later(self, url: str, delay: int = 0):
+            """记录网址并稍后导航，恢复多个网页组件时错开加载以免阻塞启动"""
+            self.url = url
+            self.url_input.setText(url)
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._load_pending_url)
+            timer.timeout.connect(timer.deleteLater)
+            timer.start(delay)
+
+        def _load_pending_url(self):
+            if self.url:
+                self.web_view.setUrl(QUrl(self.url))
+
+        def _show_placeholder(self):
+            """显示占位页面（同一主题下 HTML 只格式化一次）"""
+            self.web_view.setHtml(theme.qss(self.PLACEHOLDER_HTML))
+
+        def update_style(self):
+            """更新样式"""
+            super().update_style()
+            # 仍在显示占位页面时按新主题重新生成
+            if self._placeholder_shown and not self.url:
+                self._show_placeholder()
 
         def _load_url(self):
             """加载网址"""
@@ -3097,14 +4032,12 @@ if WEBENGINE_AVAILABLE:
                 url = "https://" + url
 
             self.url = url
-            from PyQt6.QtCore import QUrl
             self.web_view.setUrl(QUrl(url))
 
             # 保存配置
-            for widget_config in config.widgets:
-                if widget_config.get("id") == self.widget_id:
-                    widget_config["url"] = self.url
-                    break
+            widget_config = config.get_widget(self.widget_id)
+            if widget_config is not None:
+                widget_config["url"] = self.url
             config.save()
 
         def _go_back(self):
@@ -3128,61 +4061,21 @@ if WEBENGINE_AVAILABLE:
             if url:
                 self.url = url
                 self.url_input.setText(url)
-                from PyQt6.QtCore import QUrl
                 self.web_view.setUrl(QUrl(url))
 
-        def _context_menu(self, event):
+        def _build_context_menu(self, menu: QMenu):
             """右键菜单"""
-            from PyQt6.QtWidgets import QMenu
-
-            menu = QMenu(self)
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {theme.bg_card};
-                    border: 1px solid {theme.border};
-                    border-radius: 8px;
-                    padding: 6px 4px;
-                    font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                    font-size: 13px;
-                }}
-                QMenu::item {{
-                    padding: 6px 24px;
-                    border-radius: 4px;
-                }}
-                QMenu::item:selected {{
-                    background-color: {theme.bg_hover};
-                }}
-            """)
-
             # 控制栏显示/隐藏
-            control_action = menu.addAction("显示控制栏")
-            control_action.setCheckable(True)
-            control_action.setChecked(self.control_bar.isVisible())
-            control_action.triggered.connect(self._toggle_control_bar)
-
-            menu.addSeparator()
-
-            # 鼠标穿透选项
-            click_through_action = menu.addAction("鼠标穿透")
-            click_through_action.setCheckable(True)
-            click_through_action.setChecked(self.click_through)
-            click_through_action.triggered.connect(self._toggle_click_through)
+            self._control_bar_action = menu.addAction("显示控制栏")
+            self._control_bar_action.setCheckable(True)
+            self._control_bar_action.triggered.connect(self._toggle_control_bar)
 
             menu.addSeparator()
+            super()._build_context_menu(menu)
 
-            # 窗口层级选项
-            top_action = menu.addAction("置顶显示")
-            top_action.triggered.connect(self._bring_to_top)
-
-            bottom_action = menu.addAction("置底显示")
-            bottom_action.triggered.connect(self._send_to_bottom)
-
-            menu.addSeparator()
-
-            close_action = menu.addAction("关闭小组件")
-            close_action.triggered.connect(self._on_close)
-
-            menu.exec(event.globalPos())
+        def _update_context_menu(self):
+            super()._update_context_menu()
+            self._control_bar_action.setChecked(self.control_bar.isVisible())
 
         def _toggle_control_bar(self):
             """切换控制栏显示"""
@@ -3193,13 +4086,17 @@ if WEBENGINE_AVAILABLE:
             pass
 
         def resizeEvent(self, event):
-            """组件大小变化时自动调整网页缩放"""
+            """组件大小变化时自动调整网页缩放（延迟应用）"""
             super().resizeEvent(event)
             if self.web_view:
-                # 基于组件宽度计算缩放比例（以 480px 为基准）
-                base_width = 480
-                current_width = self.width()
-                zoom_factor = max(0.5, min(2.0, current_width / base_width))
+                self._zoom_timer.start()
+
+        def _apply_zoom(self):
+            """按组件宽度应用网页缩放，变化小于 0.02 时忽略"""
+            # 基于组件宽度计算缩放比例（以 480px 为基准）
+            base_width = 480
+            zoom_factor = max(0.5, min(2.0, self.width() / base_width))
+            if abs(zoom_factor - self.web_view.zoomFactor()) >= 0.02:
                 self.web_view.setZoomFactor(zoom_factor)
 
 
@@ -3219,10 +4116,19 @@ class WidgetManager(QMainWindow):
         "WorldClockWidget": WorldClockWidget,
         "NetworkMonitorWidget": NetworkMonitorWidget,
     }
+    # 启动恢复时相邻网页组件开始导航的间隔（毫秒）
+    WEB_RESTORE_STAGGER = 50
+    # 启动恢复时每轮事件循环创建的小组件数量
+    RESTORE_BATCH = 2
+    # 托盘提示标题与显示时长（毫秒）
+    TRAY_TITLE = "DashWidgets"
+    NOTICE_TIMEOUT = 2000
 
     def __init__(self):
         super().__init__()
         self.widgets: Dict[str, BaseWidget] = {}
+        # 开机自启动状态只在用户切换时改变，查过一次注册表后缓存
+        self._autostart_cache: Optional[bool] = None
 
         # 可用小组件类型
         self.available_widgets = [
@@ -3253,8 +4159,24 @@ class WidgetManager(QMainWindow):
         self._hotkey_id = 1
         self._register_hotkey()
 
-        self._init_ui()
+        # 启动时只建托盘，管理器界面和小组件等事件循环开始后再创建，托盘图标尽早出现
+        self._late_initialized = False
+        self._pending_notice = None
+        self._reveal_pending = False
+        self._restore_queue: deque = deque()
+        self._restore_timer: Optional[QTimer] = None
+        self._restore_done = None
+        self._web_load_delay = 0
         self._init_tray()
+        QTimer.singleShot(0, self._late_init)
+
+    def _late_init(self):
+        """事件循环启动后再构建管理器界面并恢复小组件"""
+        if self._late_initialized:
+            return
+        self._late_initialized = True
+        self._build_tray_menu()
+        self._init_ui()
         self._restore_widgets()
 
     def _init_ui(self):
@@ -3274,7 +4196,6 @@ class WidgetManager(QMainWindow):
         main_layout.addWidget(self.sidebar)
 
         # 导航栏宽度动画
-        from PyQt6.QtCore import QVariantAnimation
         self._sidebar_anim = QVariantAnimation(self)
         self._sidebar_anim.setDuration(200)
         self._sidebar_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
@@ -3288,10 +4209,14 @@ class WidgetManager(QMainWindow):
         self.content_layout.setSpacing(16)
         main_layout.addWidget(self.content_stack, 1)
 
-        # 创建各页面
+        # 创建各页面（设置页和关于页在首次访问时才创建）
+        self.settings_page = None
+        self.about_page = None
+        self._lazy_pages = {
+            "settings": self._create_settings_page,
+            "about": self._create_about_page,
+        }
         self._create_widgets_page()
-        self._create_settings_page()
-        self._create_about_page()
 
         # 默认显示小组件页面
         self._show_page("widgets")
@@ -3486,7 +4411,12 @@ class WidgetManager(QMainWindow):
         # 搜索框
         self.widget_search = QLineEdit()
         self.widget_search.setPlaceholderText("🔍 搜索小组件...")
-        self.widget_search.textChanged.connect(self._filter_available_widgets)
+        # 连续输入合并为一次过滤
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(80)
+        self._search_timer.timeout.connect(self._filter_available_widgets)
+        self.widget_search.textChanged.connect(self._search_timer.start)
         self.widget_search.setStyleSheet(f"""
             QLineEdit {{
                 background: {theme.bg_input};
@@ -3517,23 +4447,12 @@ class WidgetManager(QMainWindow):
         self.widgets_page = page
         self.content_layout.addWidget(page)
 
-    def _populate_available_widgets_grid(self, filter_text=""):
-        """填充可用小组件网格"""
-        # 清除现有内容
-        while self.available_layout.count():
-            item = self.available_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        filtered_widgets = self.available_widgets
-        if filter_text:
-            filter_lower = filter_text.lower()
-            filtered_widgets = [
-                (name, desc, cls) for name, desc, cls in self.available_widgets
-                if filter_lower in name.lower() or filter_lower in desc.lower()
-            ]
-
-        for idx, (name, desc, widget_class) in enumerate(filtered_widgets):
+    def _populate_available_widgets_grid(self):
+        """创建可用小组件卡片（只创建一次，搜索时仅调整显示和位置）"""
+        self._widget_cards = []  # (名称小写, 描述小写, 卡片)
+        self._shown_cards = None  # 当前显示的卡片下标
+
+        for name, desc, widget_class in self.available_widgets:
             card = QFrame()
             card.setObjectName("widget_card")
             card.setFixedSize(150, 90)
@@ -3555,11 +4474,29 @@ class WidgetManager(QMainWindow):
 
             # 点击添加
             card.mousePressEvent = lambda e, w=widget_class, n=name: self._add_widget(w, n)
-            self.available_layout.addWidget(card, idx // 3, idx % 3)
+            self._widget_cards.append((name.lower(), desc.lower(), card))
+
+        self._filter_available_widgets()
 
-    def _filter_available_widgets(self, text):
-        """过滤可用小组件"""
-        self._populate_available_widgets_grid(text)
+    def _filter_available_widgets(self):
+        """按搜索框内容过滤可用小组件（匹配结果不变时不重新布局）"""
+        filter_lower = self.widget_search.text().lower()
+        shown = tuple(
+            idx for idx, (name, desc, _) in enumerate(self._widget_cards)
+            if filter_lower in name or filter_lower in desc
+        )
+        if shown == self._shown_cards:
+            return
+        self._shown_cards = shown
+
+        # 匹配的卡片依次排到网格前面，其余隐藏
+        for _, _, card in self._widget_cards:
+            self.available_layout.removeWidget(card)
+            card.hide()
+        for pos, idx in enumerate(shown):
+            card = self._widget_cards[idx][2]
+            self.available_layout.addWidget(card, pos // 3, pos % 3)
+            card.show()
 
     def _create_settings_page(self):
         """创建设置页面"""
@@ -3626,9 +4563,8 @@ class WidgetManager(QMainWindow):
         color_row.addStretch()
 
         self.color_combo = QComboBox()
-        self.color_combo.addItems(["蓝色", "绿色", "紫色", "橙色", "红色", "青色"])
-        color_map = {"blue": 0, "green": 1, "purple": 2, "orange": 3, "red": 4, "teal": 5}
-        self.color_combo.setCurrentIndex(color_map.get(config.color_scheme, 0))
+        self.color_combo.addItems(ThemeColors.SCHEME_LABELS)
+        self.color_combo.setCurrentIndex(ThemeColors.SCHEME_INDEX.get(config.color_scheme, 0))
         self.color_combo.currentIndexChanged.connect(self._on_color_changed)
         self.color_combo.setStyleSheet(f"""
             QComboBox {{
@@ -3660,7 +4596,14 @@ class WidgetManager(QMainWindow):
         self.opacity_slider.setRange(50, 100)
         self.opacity_slider.setValue(int(config.widget_opacity * 100))
         self.opacity_slider.valueChanged.connect(self._on_opacity_changed)
+        self.opacity_slider.sliderReleased.connect(config.flush)
         opacity_row.addWidget(self.opacity_slider)
+
+        # 拖动滑块时合并透明度刷新，每帧最多重绘一次
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(16)
+        self._opacity_timer.timeout.connect(self._apply_widget_opacity)
         appearance_layout.addLayout(opacity_row)
 
         layout.addWidget(appearance_card)
@@ -3691,7 +4634,7 @@ class WidgetManager(QMainWindow):
 
         self.snap_checkbox = QCheckBox()
         self.snap_checkbox.setChecked(config.snap_enabled)
-        self.snap_checkbox.stateChanged.connect(self._on_snap_changed)
+        self.snap_checkbox.toggled.connect(self._on_snap_changed)
         snap_row.addWidget(self.snap_checkbox)
         behavior_layout.addLayout(snap_row)
 
@@ -3713,6 +4656,7 @@ class WidgetManager(QMainWindow):
         self.threshold_slider.setRange(10, 50)
         self.threshold_slider.setValue(config.snap_threshold)
         self.threshold_slider.valueChanged.connect(self._on_threshold_changed)
+        self.threshold_slider.sliderReleased.connect(config.flush)
         threshold_row.addWidget(self.threshold_slider)
         behavior_layout.addLayout(threshold_row)
 
@@ -3726,38 +4670,36 @@ class WidgetManager(QMainWindow):
         """透明度改变"""
         config.widget_opacity = value / 100
         self.opacity_value_label.setText(f"{value}%")
-        config.save()
+        # 拖动过程中延迟保存，松开滑块时立即写入
+        config.save_later()
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
 
-        # 更新所有小组件透明度
-        for widget in self.widgets.values():
-            widget.opacity = config.widget_opacity
-            widget.update()
+    def _apply_widget_opacity(self):
+        """通知所有小组件按新透明度重绘"""
+        WidgetOpacity.instance().changed.emit()
 
     def _on_color_changed(self, index):
         """配色方案改变"""
-        colors = ["blue", "green", "purple", "orange", "red", "teal"]
-        config.color_scheme = colors[index]
+        config.color_scheme = ThemeColors.SCHEME_NAMES[index]
         config.save()
 
         # 更新主题颜色
         theme.color_scheme = config.color_scheme
         theme._update_colors()
+        self._on_theme_changed()
 
-        # 刷新所有小组件样式
-        for widget in self.widgets.values():
-            widget.update_style()
-        self._apply_styles()
-
-    def _on_snap_changed(self, state):
+    def _on_snap_changed(self, checked: bool):
         """吸附开关改变"""
-        config.snap_enabled = state == Qt.CheckState.Checked.value
+        config.snap_enabled = checked
         config.save()
 
     def _on_threshold_changed(self, value):
         """吸附阈值改变"""
         config.snap_threshold = value
         self.threshold_value_label.setText(f"{value} 像素")
-        config.save()
+        # 拖动过程中延迟保存，松开滑块时立即写入
+        config.save_later()
 
     def _create_about_page(self):
         """创建关于页面"""
@@ -3815,9 +4757,13 @@ class WidgetManager(QMainWindow):
 
     def _show_page(self, page_key):
         """显示指定页面"""
-        self.widgets_page.setVisible(page_key == "widgets")
-        self.settings_page.setVisible(page_key == "settings")
-        self.about_page.setVisible(page_key == "about")
+        create_page = self._lazy_pages.pop(page_key, None)
+        if create_page is not None:
+            create_page()
+        for key, page in (("widgets", self.widgets_page), ("settings", self.settings_page),
+                          ("about", self.about_page)):
+            if page is not None:
+                page.setVisible(key == page_key)
 
         # 更新导航按钮状态
         for key, btn in self.nav_buttons.items():
@@ -3825,18 +4771,31 @@ class WidgetManager(QMainWindow):
 
     def _on_active_item_double_clicked(self, item):
         """双击活动小组件项"""
-        widget_id = item.data(Qt.ItemDataRole.UserRole)
-        if widget_id in self.widgets:
-            self.widgets[widget_id].raise_()
-            self.widgets[widget_id].activateWindow()
+        widget = self.widgets.get(item.data(Qt.ItemDataRole.UserRole))
+        if widget is not None:
+            widget.raise_()
+            widget.activateWindow()
 
     def _refresh_widget_list(self):
-        """刷新已添加的小组件列表"""
-        self.active_list.clear()
+        """刷新已添加的小组件列表（只增删有变化的行，列表没变化时不做任何操作）"""
+        role = Qt.ItemDataRole.UserRole
+        listed = set()
+        self.active_list.setUpdatesEnabled(False)
+        # 倒序删除已移除组件的行，保证下标不受影响
+        for row in range(self.active_list.count() - 1, -1, -1):
+            widget_id = self.active_list.item(row).data(role)
+            if widget_id in self.widgets:
+                listed.add(widget_id)
+            else:
+                # 取出的条目归 Python 所有，丢弃即释放
+                self.active_list.takeItem(row)
+        # 新组件总是追加在字典末尾，按顺序追加即可保持与 self.widgets 一致
         for widget_id, widget in self.widgets.items():
-            item = QListWidgetItem(f"{widget.widget_name} ({widget_id})")
-            item.setData(Qt.ItemDataRole.UserRole, widget_id)
-            self.active_list.addItem(item)
+            if widget_id not in listed:
+                item = QListWidgetItem(f"{widget.widget_name} ({widget_id})")
+                item.setData(role, widget_id)
+                self.active_list.addItem(item)
+        self.active_list.setUpdatesEnabled(True)
         self.status_label.setText(f"运行中: {len(self.widgets)} 个小组件")
 
     def _remove_selected_widget(self):
@@ -3848,271 +4807,22 @@ class WidgetManager(QMainWindow):
                 self.widgets[widget_id].close()
 
     def _apply_theme(self):
-        """应用主题样式 - Windows 11 风格"""
-        style_sheet = f"""
-            /* 全局 */
-            QMainWindow {{
-                background-color: {theme.bg_main};
-            }}
-            QWidget {{
-                color: {theme.text_primary};
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-                font-weight: normal;
-            }}
-
-            /* 侧边栏 */
-            #sidebar {{
-                background-color: {theme.bg_sidebar};
-                border-right: 1px solid {theme.border};
-            }}
-            /* 内容区 */
-            #content_stack {{
-                background-color: {theme.bg_main};
-            }}
-            #sidebar_title {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {theme.text_primary};
-                padding: 8px 12px;
-            }}
-            #nav_button {{
-                background-color: transparent;
-                color: {theme.text_primary};
-                border: none;
-                border-radius: 4px;
-                padding: 10px 12px;
-                text-align: left;
-                font-size: 13px;
-            }}
-            #nav_button:hover {{
-                background-color: {theme.bg_hover};
-            }}
-            #nav_button[active="true"] {{
-                background-color: {theme.bg_pressed};
-                font-weight: 500;
-            }}
-            #status_label {{
-                color: {theme.text_tertiary};
-                font-size: 12px;
-                padding: 8px 12px;
-            }}
-
-            /* 页面标题 */
-            #page_title {{
-                font-size: 28px;
-                font-weight: 600;
-                color: {theme.text_primary};
-            }}
-            #page_subtitle {{
-                font-size: 14px;
-                color: {theme.text_secondary};
-            }}
-            #section_title {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {theme.text_primary};
-            }}
-
-            /* 卡片 */
-            #card {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-            }}
-            #card_header {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {theme.text_primary};
-            }}
-            #card_title {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {theme.text_primary};
-            }}
-            #card_desc {{
-                font-size: 12px;
-                color: {theme.text_secondary};
-            }}
-
-            /* 小组件卡片 */
-            #widget_card {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-            }}
-            #widget_card:hover {{
-                border-color: {theme.accent};
-                background-color: {theme.bg_hover};
-            }}
-
-            /* 设置项 */
-            #setting_label {{
-                font-size: 14px;
-                color: {theme.text_primary};
-            }}
-            #setting_desc {{
-                font-size: 12px;
-                color: {theme.text_secondary};
-            }}
-
-            /* 关于 */
-            #about_title {{
-                font-size: 18px;
-                font-weight: 600;
-                color: {theme.text_primary};
-            }}
-
-            /* 按钮 */
-            QPushButton {{
-                background-color: {theme.bg_card};
-                color: {theme.text_primary};
-                border: 1px solid {theme.border};
-                border-radius: 4px;
-                padding: 6px 14px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.bg_hover};
-                border-color: {theme.border};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme.bg_pressed};
-            }}
-            #accent_button {{
-                background-color: {theme.accent};
-                color: white;
-                border: none;
-            }}
-            #accent_button:hover {{
-                background-color: {theme.accent_hover};
-            }}
-
-            /* 列表 */
-            QListWidget {{
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item {{
-                padding: 8px;
-                border-radius: 4px;
-                color: {theme.text_primary};
-            }}
-            QListWidget::item:selected {{
-                background-color: {theme.accent};
-                color: white;
-            }}
-            QListWidget::item:hover:!selected {{
-                background-color: {theme.bg_hover};
-            }}
-
-            /* 菜单 */
-            QMenu {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 8px 24px 8px 12px;
-                border-radius: 4px;
-                background: transparent;
-                color: {theme.text_primary};
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.bg_hover};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme.border};
-                margin: 4px 8px;
-            }}
-
-            /* 滚动条 - Fluent 风格 */
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 8px;
-                margin: 0;
-                padding: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {theme.text_tertiary};
-                min-height: 30px;
-                border-radius: 4px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {theme.text_secondary};
-            }}
-            QScrollBar::handle:vertical:pressed {{
-                background: {theme.text_primary};
-            }}
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {{
-                height: 0;
-                background: transparent;
-            }}
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-
-            QScrollBar:horizontal {{
-                background: transparent;
-                height: 8px;
-                margin: 0;
-                padding: 0;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {theme.text_tertiary};
-                min-width: 30px;
-                border-radius: 4px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {theme.text_secondary};
-            }}
-            QScrollBar::handle:horizontal:pressed {{
-                background: {theme.text_primary};
-            }}
-            QScrollBar::add-line:horizontal,
-            QScrollBar::sub-line:horizontal {{
-                width: 0;
-                background: transparent;
-            }}
-            QScrollBar::add-page:horizontal,
-            QScrollBar::sub-page:horizontal {{
-                background: transparent;
-            }}
-
-            /* 滚动区域 */
-            QScrollArea {{
-                border: none;
-                background: transparent;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background: transparent;
-            }}
-        """
-        self.setStyleSheet(style_sheet)
-        # 强制刷新所有子控件
-        for child in self.findChildren(QWidget):
-            child.style().unpolish(child)
-            child.style().polish(child)
-            child.update()
+        """应用主题样式 - Windows 11 风格（同一主题下模板只格式化一次，内容未变时不重新设置）"""
+        apply_style_sheet(self, theme.qss(MANAGER_QSS))
 
     def _create_tray_icon(self):
         """创建托盘图标"""
-        from PyQt6.QtGui import QIcon
-
         # 使用 assets 中的 logo.ico
         logo_path = IMAGES_DIR / "logo.ico"
-        if logo_path.exists():
+        self._tray_has_logo = logo_path.exists()
+        if self._tray_has_logo:
             return QIcon(str(logo_path))
 
-        # 如果图标不存在，创建一个默认图标
-        from PyQt6.QtGui import QPixmap, QFont
+        # 如果图标不存在，使用按强调色绘制的默认图标（通过 QPixmapCache 缓存）
+        cache_key = f"tray:{theme.accent}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return QIcon(pixmap)
 
         pixmap = QPixmap(32, 32)
         pixmap.fill(Qt.GlobalColor.transparent)
@@ -4127,26 +4837,38 @@ class WidgetManager(QMainWindow):
 
         # 绘制D字母
         painter.setPen(QPen(QColor(255, 255, 255), 2.5))
-        font = QFont("Segoe UI", 14, QFont.Weight.Bold)
+        font = QFont(ui_font_family, 14, QFont.Weight.Bold)
         painter.setFont(font)
         painter.drawText(QRect(0, 0, 32, 32), Qt.AlignmentFlag.AlignCenter, "D")
 
         painter.end()
 
+        QPixmapCache.insert(cache_key, pixmap)
         return QIcon(pixmap)
 
     def _init_tray(self):
-        """初始化系统托盘"""
+        """初始化系统托盘（系统没有托盘区时不创建）"""
+        self.tray_icon = None
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            logger.warning("系统托盘不可用")
+            return
         self.tray_icon = QSystemTrayIcon(self)
         # 使用自定义图标
         self.tray_icon.setIcon(self._create_tray_icon())
-        self.tray_icon.setToolTip("DashWidgets")
+        self.tray_icon.setToolTip(self.TRAY_TITLE)
+        self.tray_icon.activated.connect(self._on_tray_activated)
+        # 先显示图标，右键菜单在事件循环开始后由 _late_init 构建
+        self.tray_icon.show()
 
+    def _build_tray_menu(self):
+        """构建托盘右键菜单"""
+        if self.tray_icon is None:
+            return
         self.tray_menu = QMenu()
         self._apply_tray_menu_style()
 
         show_action = self.tray_menu.addAction("打开管理器")
-        show_action.triggered.connect(self.show)
+        show_action.triggered.connect(self._request_reveal)
 
         theme_action = self.tray_menu.addAction("切换主题")
         theme_action.triggered.connect(self._toggle_theme)
@@ -4175,57 +4897,50 @@ class WidgetManager(QMainWindow):
         quit_action.triggered.connect(self._quit_app)
 
         self.tray_icon.setContextMenu(self.tray_menu)
-        self.tray_icon.activated.connect(self._on_tray_activated)
-        self.tray_icon.show()
+
+    def _notify(self, message: str, icon=QSystemTrayIcon.MessageIcon.Information):
+        """通过托盘气泡显示提示（没有托盘或平台不支持气泡时只记日志）"""
+        if self.tray_icon is None or not self.tray_icon.supportsMessages():
+            logger.info(message)
+            return
+        # showMessage 会同步等待系统外壳，推迟到下一轮事件循环；连续多条时只显示最后一条
+        pending = self._pending_notice is not None
+        self._pending_notice = (message, icon)
+        if not pending:
+            QTimer.singleShot(0, self._show_pending_notice)
+
+    def _show_pending_notice(self):
+        if self._pending_notice is None or self.tray_icon is None:
+            return
+        message, icon = self._pending_notice
+        self._pending_notice = None
+        self.tray_icon.showMessage(self.TRAY_TITLE, message, icon, self.NOTICE_TIMEOUT)
 
     def _apply_tray_menu_style(self):
-        """应用托盘菜单样式 - Fluent风格"""
-        self.tray_menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {theme.bg_card};
-                border: 1px solid {theme.border};
-                border-radius: 8px;
-                padding: 6px 4px;
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                font-size: 13px;
-            }}
-            QMenu::item {{
-                padding: 8px 28px 8px 16px;
-                border-radius: 4px;
-                background: transparent;
-                color: {theme.text_primary};
-                margin: 1px 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme.bg_hover};
-            }}
-            QMenu::item:pressed {{
-                background-color: {theme.bg_pressed};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme.border};
-                margin: 4px 12px;
-            }}
-        """)
+        """应用托盘菜单样式 - Fluent风格（与小组件右键菜单共用模板和缓存）"""
+        apply_style_sheet(self.tray_menu, theme.qss(MENU_QSS))
 
     def _on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
-            self.show()
+            self._request_reveal()
 
     def _add_widget(self, widget_class, name: str):
         """添加小组件"""
-        import uuid
         widget_id = str(uuid.uuid4())[:8]
 
-        widget = widget_class(widget_id, "medium")
+        try:
+            widget = widget_class(widget_id, "medium")
+        except Exception as e:
+            logger.error(f"创建小组件失败 {name}: {e}")
+            self._notify(f"创建失败: {e}", QSystemTrayIcon.MessageIcon.Warning)
+            return
         widget.closed.connect(self._remove_widget)
         widget.show()
 
         self.widgets[widget_id] = widget
 
         # 保存配置
-        config.widgets.append({
+        config.add_widget({
             "id": widget_id,
             "type": widget_class.__name__,
             "name": name,
@@ -4244,7 +4959,7 @@ class WidgetManager(QMainWindow):
         if widget_id in self.widgets:
             del self.widgets[widget_id]
 
-        config.widgets = [w for w in config.widgets if w.get("id") != widget_id]
+        config.remove_widget(widget_id)
         config.save()
 
         self._refresh_widget_list()
@@ -4268,27 +4983,29 @@ class WidgetManager(QMainWindow):
         config.light_mode = theme.light_mode
         config.save()
 
-        self._apply_theme()
-        self._apply_tray_menu_style()
+        self._on_theme_changed()
         self._refresh_widget_list()
 
+        theme_name = "浅色" if theme.light_mode else "深色"
+        self.status_label.setText(f"已切换到{theme_name}主题")
+        logger.info(f"切换主题: {theme_name}")
+
+    def _on_theme_changed(self):
+        """主题颜色变化后刷新管理器和所有小组件"""
+        self._apply_theme()
+        if self.tray_icon is not None:
+            self._apply_tray_menu_style()
+            # 默认托盘图标跟随强调色（使用 logo 时不变）
+            if not self._tray_has_logo:
+                self.tray_icon.setIcon(self._create_tray_icon())
+
         # 更新导航按钮样式
         for btn in self.nav_buttons.values():
             btn.update_style()
 
-        # 更新可用小组件网格
-        available_layout = self.available_frame.layout()
-        if available_layout:
-            self._populate_available_widgets_grid(available_layout)
-
-        # 更新所有小组件样式
+        # 可见的小组件立即刷新，隐藏的在下次显示时刷新
         for widget in self.widgets.values():
-            widget.update_style()
-            widget.update()  # 强制重绘
-
-        theme_name = "浅色" if theme.light_mode else "深色"
-        self.status_label.setText(f"已切换到{theme_name}主题")
-        logger.info(f"切换主题: {theme_name}")
+            widget.refresh_theme()
 
     def _disable_all_click_through(self):
         """解除所有小组件的鼠标穿透模式"""
@@ -4298,132 +5015,152 @@ class WidgetManager(QMainWindow):
                 widget.click_through = False
 
                 # 使用Windows API解除鼠标穿透
-                hwnd = int(widget.winId())
-                ex_style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+                hwnd = widget._get_hwnd()
+                ex_style = _GetWindowLongW(hwnd, GWL_EXSTYLE)
                 ex_style &= ~WS_EX_TRANSPARENT  # 移除透明样式
-                ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
+                _SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
 
                 # 保存配置
-                for widget_config in config.widgets:
-                    if widget_config.get("id") == widget.widget_id:
-                        widget_config["click_through"] = False
-                        break
+                widget_config = config.get_widget(widget.widget_id)
+                if widget_config is not None:
+                    widget_config["click_through"] = False
                 count += 1
 
         if count > 0:
             config.save()
-            self.tray_icon.showMessage(
-                "DashWidgets",
-                f"已解除 {count} 个组件的鼠标穿透",
-                QSystemTrayIcon.MessageIcon.Information,
-                2000
-            )
+            self._notify(f"已解除 {count} 个组件的鼠标穿透")
         else:
-            self.tray_icon.showMessage(
-                "DashWidgets",
-                "没有启用了鼠标穿透的组件",
-                QSystemTrayIcon.MessageIcon.Information,
-                2000
-            )
+            self._notify("没有启用了鼠标穿透的组件")
 
-    def _restore_widgets(self):
-        """恢复已保存的小组件"""
-        for widget_config in config.widgets:
-            widget_id = widget_config.get("id")
-            widget_type = widget_config.get("type")
-            widget_name = widget_config.get("name", "未知")
-            widget_size = widget_config.get("size", "medium")
-            position = widget_config.get("position", [100, 100])
-            click_through = widget_config.get("click_through", False)
-
-            widget_class = self.WIDGET_CLASSES.get(widget_type)
-            if widget_class and widget_id:
-                try:
-                    widget = widget_class(widget_id, widget_size)
-                    widget.closed.connect(self._remove_widget)
-
-                    # 恢复位置
-                    if len(position) >= 2:
-                        widget.move(position[0], position[1])
-
-                    # 恢复图片小组件的图片路径
-                    if widget_type == "ImageWidget":
-                        image_path = widget_config.get("image_path", "")
-                        if image_path:
-                            widget.image_path = image_path
-                        # 恢复裁剪区域
-                        crop_rect_data = widget_config.get("crop_rect")
-                        if crop_rect_data and len(crop_rect_data) == 4:
-                            widget.crop_rect = QRect(
-                                crop_rect_data[0], crop_rect_data[1],
-                                crop_rect_data[2], crop_rect_data[3]
-                            )
-
-                    # 恢复网页小组件的网址
-                    if widget_type == "WebWidget":
-                        url = widget_config.get("url", "")
-                        if url:
-                            widget.url = url
-                            widget.url_input.setText(url)
-                            from PyQt6.QtCore import QUrl
-                            widget.web_view.setUrl(QUrl(url))
-
-                    widget.show()
-
-                    # 恢复鼠标穿透状态（需要在show之后，因为需要窗口句柄）
-                    if click_through:
-                        widget.click_through = True
-                        hwnd = int(widget.winId())
-                        ex_style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-                        ex_style |= WS_EX_TRANSPARENT | WS_EX_LAYERED
-                        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
-
-                    self.widgets[widget_id] = widget
-                    logger.info(f"恢复小组件: {widget_name} ({widget_id})")
-                except Exception as e:
-                    logger.error(f"恢复小组件失败 {widget_name}: {e}")
+    def _restore_widgets(self, on_done=None):
+        """恢复已保存的小组件（分批在事件循环中创建，启动期间界面保持响应）
+
+        on_done 在最后一批创建完成后调用。
+        """
+        self._cancel_restore()
+        self._restore_done = on_done
+        self._restore_queue = deque(config.widgets)
+        self._web_load_delay = 0
+        BaseWidget._defer_top_state = True
+        if self._restore_timer is None:
+            self._restore_timer = QTimer(self)
+            self._restore_timer.setInterval(0)
+            self._restore_timer.timeout.connect(self._restore_next_batch)
+        self._restore_timer.start()
+
+    def _restore_next_batch(self):
+        """每轮事件循环恢复 RESTORE_BATCH 个小组件，全部完成后统一提交窗口层级"""
+        for _ in range(self.RESTORE_BATCH):
+            if not self._restore_queue:
+                break
+            self._restore_widget(self._restore_queue.popleft())
+        if self._restore_queue:
+            return
 
+        self._restore_timer.stop()
+        BaseWidget._defer_top_state = False
+        # 一次性提交所有小组件的窗口层级
+        BaseWidget.apply_top_state_bulk(self.widgets.values())
         self._refresh_widget_list()
+        on_done, self._restore_done = self._restore_done, None
+        if on_done is not None:
+            on_done()
+
+    def _cancel_restore(self):
+        """停止尚未完成的恢复，丢弃剩余队列"""
+        if self._restore_timer is not None:
+            self._restore_timer.stop()
+        self._restore_queue.clear()
+        self._restore_done = None
+        BaseWidget._defer_top_state = False
+
+    def _restore_widget(self, widget_config: dict):
+        """按配置创建单个小组件"""
+        widget_id = widget_config.get("id")
+        widget_type = widget_config.get("type")
+        widget_name = widget_config.get("name", "未知")
+        widget_size = widget_config.get("size", "medium")
+        position = widget_config.get("position", [100, 100])
+        click_through = widget_config.get("click_through", False)
+
+        widget_class = self.WIDGET_CLASSES.get(widget_type)
+        if widget_class and widget_id:
+            try:
+                widget = widget_class(widget_id, widget_size)
+                widget.closed.connect(self._remove_widget)
+
+                # 恢复位置
+                if len(position) >= 2:
+                    widget.move(position[0], position[1])
+
+                # 恢复图片小组件的图片路径
+                if widget_type == "ImageWidget":
+                    image_path = widget_config.get("image_path", "")
+                    if image_path:
+                        widget.image_path = image_path
+                    # 恢复裁剪区域
+                    crop_rect_data = widget_config.get("crop_rect")
+                    if crop_rect_data and len(crop_rect_data) == 4:
+                        widget.crop_rect = QRect(
+                            crop_rect_data[0], crop_rect_data[1],
+                            crop_rect_data[2], crop_rect_data[3]
+                        )
+
+                # 恢复网页小组件的网址
+                if widget_type == "WebWidget":
+                    url = widget_config.get("url", "")
+                    if url:
+                        # 导航推迟到事件循环中逐个进行，避免启动时依次同步拉起渲染进程
+                        widget.load_url_later(url, self._web_load_delay)
+                        self._web_load_delay += self.WEB_RESTORE_STAGGER
+
+                widget.show()
+
+                # 恢复鼠标穿透状态（需要在show之后，因为需要窗口句柄）
+                if click_through:
+                    widget.click_through = True
+                    hwnd = widget._get_hwnd()
+                    ex_style = _GetWindowLongW(hwnd, GWL_EXSTYLE)
+                    ex_style |= WS_EX_TRANSPARENT | WS_EX_LAYERED
+                    _SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
+
+                self.widgets[widget_id] = widget
+                logger.info(f"恢复小组件: {widget_name} ({widget_id})")
+            except Exception as e:
+                logger.error(f"恢复小组件失败 {widget_name}: {e}")
 
     def _is_autostart_enabled(self) -> bool:
         """检查是否已启用开机自启动"""
-        import sys
-        import winreg
-
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_READ)
-            winreg.QueryValueEx(key, "DashWidgets")
-            winreg.CloseKey(key)
-            return True
-        except WindowsError:
-            return False
+        if self._autostart_cache is None:
+            try:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_READ) as key:
+                    winreg.QueryValueEx(key, AUTOSTART_NAME)
+                self._autostart_cache = True
+            except OSError:
+                self._autostart_cache = False
+        return self._autostart_cache
 
     def _toggle_autostart(self):
         """切换开机自启动"""
-        import sys
-        import winreg
-
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
         exe_path = sys.executable if getattr(sys, 'frozen', False) else f'"{sys.executable}" "{__file__}"'
 
         if self.autostart_action.isChecked():
             try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_WRITE)
-                winreg.SetValueEx(key, "DashWidgets", 0, winreg.REG_SZ, exe_path)
-                winreg.CloseKey(key)
-                self.tray_icon.showMessage("DashWidgets", "已启用开机自启动", QSystemTrayIcon.MessageIcon.Information, 2000)
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_WRITE) as key:
+                    winreg.SetValueEx(key, AUTOSTART_NAME, 0, winreg.REG_SZ, exe_path)
+                self._autostart_cache = True
+                self._notify("已启用开机自启动")
             except Exception as e:
                 self.autostart_action.setChecked(False)
-                self.tray_icon.showMessage("DashWidgets", f"设置失败: {e}", QSystemTrayIcon.MessageIcon.Warning, 2000)
+                self._notify(f"设置失败: {e}", QSystemTrayIcon.MessageIcon.Warning)
         else:
             try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_WRITE)
-                winreg.DeleteValue(key, "DashWidgets")
-                winreg.CloseKey(key)
-                self.tray_icon.showMessage("DashWidgets", "已关闭开机自启动", QSystemTrayIcon.MessageIcon.Information, 2000)
-            except WindowsError:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_WRITE) as key:
+                    winreg.DeleteValue(key, AUTOSTART_NAME)
+                self._notify("已关闭开机自启动")
+            except OSError:
                 pass
+            self._autostart_cache = False
 
     def _export_config(self):
         """导出配置"""
@@ -4432,14 +5169,11 @@ class WidgetManager(QMainWindow):
         )
         if file_path:
             try:
-                # 保存当前配置
-                config.save()
-                # 复制到目标位置
-                import shutil
-                shutil.copy(CONFIG_FILE, file_path)
-                self.tray_icon.showMessage("DashWidgets", f"配置已导出到: {file_path}", QSystemTrayIcon.MessageIcon.Information, 2000)
+                # 直接把当前配置写到目标位置
+                config.write_to(Path(file_path))
+                self._notify(f"配置已导出到: {file_path}")
             except Exception as e:
-                self.tray_icon.showMessage("DashWidgets", f"导出失败: {e}", QSystemTrayIcon.MessageIcon.Warning, 2000)
+                self._notify(f"导出失败: {e}", QSystemTrayIcon.MessageIcon.Warning)
 
     def _import_config(self):
         """导入配置"""
@@ -4448,96 +5182,119 @@ class WidgetManager(QMainWindow):
         )
         if file_path:
             try:
-                # 读取配置文件
-                data = json.loads(Path(file_path).read_text(encoding="utf-8"))
-                # 应用配置
-                config.widgets = data.get("widgets", [])
-                config.light_mode = data.get("light_mode", True)
-                config.widget_opacity = data.get("widget_opacity", 0.95)
+                data = config.read_file(Path(file_path))
+                # 停止尚未完成的恢复，关闭按旧配置创建的小组件（不改动配置）
+                self._cancel_restore()
+                for widget in list(self.widgets.values()):
+                    if widget in BaseWidget._all_widgets:
+                        BaseWidget._all_widgets.remove(widget)
+                    widget.close()
+                self.widgets.clear()
+                # 应用新配置
+                config.load_from_dict(data)
                 config.save()
                 # 应用主题
                 theme.light_mode = config.light_mode
+                theme.color_scheme = config.color_scheme
                 theme._update_colors()
-                # 重新加载小组件
-                self._restore_widgets()
-                self.tray_icon.showMessage("DashWidgets", "配置已导入，请重启应用以完全生效", QSystemTrayIcon.MessageIcon.Information, 2000)
+                self._on_theme_changed()
+                # 重新加载小组件，全部恢复后再提示
+                self._restore_widgets(on_done=lambda: self._notify("配置已导入，请重启应用以完全生效"))
             except Exception as e:
-                self.tray_icon.showMessage("DashWidgets", f"导入失败: {e}", QSystemTrayIcon.MessageIcon.Warning, 2000)
+                self._notify(f"导入失败: {e}", QSystemTrayIcon.MessageIcon.Warning)
 
     def _quit_app(self):
         """退出应用"""
-        self.tray_icon.hide()
+        config.flush()
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
         QApplication.quit()
 
     def _register_hotkey(self):
         """注册全局热键 (Win+Shift+D 显示/隐藏管理器)"""
-        import ctypes
-        # MOD_WIN = 0x0008, MOD_SHIFT = 0x0004, D = 0x44
-        ctypes.windll.user32.RegisterHotKey(
-            int(self.winId()), self._hotkey_id, 0x0008 | 0x0004, 0x44
-        )
+        _RegisterHotKey(int(self.winId()), self._hotkey_id, MOD_WIN | MOD_SHIFT, ord("D"))
 
     def _unregister_hotkey(self):
         """注销热键"""
-        import ctypes
-        ctypes.windll.user32.UnregisterHotKey(int(self.winId()), self._hotkey_id)
+        _UnregisterHotKey(int(self.winId()), self._hotkey_id)
 
     def nativeEvent(self, eventType, message):
         """处理Windows原生事件"""
-        if eventType == b"windows_generic_MSG":
-            import ctypes
-            msg = ctypes.cast(int(message), ctypes.POINTER(ctypes.c_uint32 * 6)).contents
-            if msg[0] == 0x0312:  # WM_HOTKEY
-                if msg[1] == self._hotkey_id:
-                    if self.isVisible():
-                        self.hide()
-                    else:
-                        self.show()
-                        self.activateWindow()
-                    return True, 0
-        return False, 0
+        if eventType != b"windows_generic_MSG":
+            return False, 0
+        # 直接按 MSG 结构体读取（64 位下 hwnd 占 8 字节，不能按 uint32 数组取下标）
+        msg = wintypes.MSG.from_address(int(message))
+        if msg.message != WM_HOTKEY or msg.wParam != self._hotkey_id:
+            return False, 0
+        if self.isVisible():
+            self.hide()
+        else:
+            self._request_reveal()
+        return True, 0
+
+    def _request_reveal(self):
+        """在下一轮事件循环显示管理器，短时间内多次请求只执行一次"""
+        if not self._reveal_pending:
+            self._reveal_pending = True
+            QTimer.singleShot(0, self._reveal)
+
+    def _reveal(self):
+        """显示、置前并激活管理器窗口"""
+        self._reveal_pending = False
+        self.show()
+        self.raise_()
+        self.activateWindow()
 
     def closeEvent(self, event):
-        """关闭时最小化到托盘"""
+        """关闭时最小化到托盘（没有托盘时直接退出，否则无法再打开）"""
+        if self.tray_icon is None:
+            event.accept()
+            self._quit_app()
+            return
         event.ignore()
         self.hide()
-        self.tray_icon.showMessage(
-            "DashWidgets",
-            "程序已最小化到系统托盘",
-            QSystemTrayIcon.MessageIcon.Information,
-            2000
-        )
+        self._notify("程序已最小化到系统托盘")
 
 
 def main():
-    # 启用高DPI缩放（PyQt6默认启用）
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-
+    # QtWebEngine 改为按需导入，需在创建 QApplication 之前允许共享 OpenGL 上下文
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    # 小组件会取 winId 变成原生窗口，不让其同级子控件也跟着创建原生句柄
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
+    # 全局像素图缓存上限（KB），图标和阴影缓存超出后自动淘汰
+    QPixmapCache.setCacheLimit(10240)
+
     # 设置应用信息
     app.setApplicationName("DashWidgets")
     app.setApplicationDisplayName("DashWidgets - 桌面小组件")
 
-    # 设置默认字体，启用抗锯齿
-    font = QFont("Segoe UI", 9)
-    font.setStyleHint(QFont.StyleHint.SansSerif)
+    # 设置默认字体，启用抗锯齿（只用已安装的字体，避免缺字体时走替换查找）
+    global ui_font_family
+    installed = set(QFontDatabase.families())
+    ui_font_family = next((f for f in UI_FONT_FAMILIES if f in installed), app.font().family())
+    font = QFont(ui_font_family, 9)
     font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
     app.setFont(font)
 
-    # 加载主题
-    global theme
-    theme = ThemeColors(light_mode=config.light_mode)
-
     manager = WidgetManager()
 
     logger.info(f"WebEngine 可用: {WEBENGINE_AVAILABLE}")
+    logger.info(f"pycaw 可用: {PYCAW_AVAILABLE}")
     logger.info("DashWidgets 启动成功")
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    # 先把需要落盘的内容写完，再跳过解释器的完整清理（逐个析构大量 QObject 很慢）
+    config.flush()
+    QThreadPool.globalInstance().waitForDone(2000)
+    if os.environ.get("DASHWIDGETS_CLEAN_EXIT") == "1":
+        # 开发时排查资源泄漏用，走正常的退出流程
+        sys.exit(exit_code)
+    logger.remove()  # 关闭日志文件，确保缓冲内容写入
+    os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""图片滤镜各实现一致性检查
+
+numpy 路径需要分别在 NumPy 1.x 和 2.x 下运行（1.x 的数值类型提升规则不同），例如：
+    pip install "numpy<2" && python -m pytest tests
+"""
+
+import sys
+
+import pytest
+
+if sys.platform != "win32":
+    pytest.skip("main.py 依赖 Win32 API", allow_module_level=True)
+
+QtGui = pytest.importorskip("PyQt6.QtGui")
+QImage, QColor = QtGui.QImage, QtGui.QColor
+
+import main  # noqa: E402
+
+PIXELS = [(200, 100, 50, 255), (255, 255, 255, 255), (0, 0, 0, 255), (12, 240, 97, 128)]
+
+
+def _make_image(fmt) -> QImage:
+    image = QImage(len(PIXELS), 1, fmt)
+    for x, (r, g, b, a) in enumerate(PIXELS):
+        image.setPixelColor(x, 0, QColor(r, g, b, a))
+    return image
+
+
+def _rgb(image: QImage) -> list:
+    return [image.pixelColor(x, 0).getRgb()[:3] for x in range(image.width())]
+
+
+def _expected(filter_type: str) -> list:
+    result = []
+    for r, g, b, _ in PIXELS:
+        if filter_type == "grayscale":
+            gray = (b * main.GRAY_Q8[0] + g * main.GRAY_Q8[1] + r * main.GRAY_Q8[2]) >> 8
+            result.append((gray, gray, gray))
+        else:
+            nb, ng, nr = (min(255, (wr * r + wg * g + wb * b) >> 7) for wr, wg, wb in main.SEPIA_Q7)
+            result.append((nr, ng, nb))
+    return result
+
+
+@pytest.fixture(params=["kernel", "numpy", "per_pixel"])
+def implementation(request, monkeypatch):
+    if request.param == "kernel" and not main.FILTER_KERNELS:
+        pytest.skip("numba 不可用")
+    if request.param in ("kernel", "numpy") and main.np is None:
+        pytest.skip("numpy 不可用")
+    if request.param == "numpy":
+        monkeypatch.setattr(main, "FILTER_KERNELS", {})
+    if request.param == "per_pixel":
+        monkeypatch.setattr(main, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("filter_type", ["grayscale", "sepia"])
+@pytest.mark.parametrize("fmt", [QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32])
+def test_filter_matches_fixed_point_reference(implementation, filter_type, fmt):
+    # 同一组 RGB 无论图片是否带透明通道、走哪种实现，结果都应一致
+    assert _rgb(main.apply_image_filter(_make_image(fmt), filter_type)) == _expected(filter_type)
+
+
+def test_grayscale_known_pixel():
+    # B=50, G=100, R=200 -> (50*29 + 100*150 + 200*77) >> 8 == 124
+    image = _make_image(QImage.Format.Format_ARGB32)
+    assert main.apply_image_filter(image, "grayscale").pixelColor(0, 0).red() == 124
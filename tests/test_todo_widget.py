@@ -0,0 +1,48 @@
+"""待办小组件从已保存配置恢复的检查"""
+
+import sys
+
+import pytest
+
+if sys.platform != "win32":
+    pytest.skip("main.py 依赖 Win32 API", allow_module_level=True)
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture
+def saved_todo(monkeypatch, tmp_path):
+    # 写盘改到临时目录，不动用户自己的配置文件
+    monkeypatch.setattr(main, "CONFIG_FILE", tmp_path / "config.json")
+    widget_config = {
+        "id": "todo-test",
+        "type": "TodoWidget",
+        "name": "待办",
+        "size": "medium",
+        "position": [100, 100],
+        "click_through": False,
+        "todos": [{"text": "写周报", "done": False}, {"text": "买牛奶", "done": True}],
+    }
+    main.config.add_widget(widget_config)
+    yield widget_config
+    main.config.remove_widget(widget_config["id"])
+
+
+def test_restore_from_saved_config(qapp, saved_todo):
+    widget = main.TodoWidget(saved_todo["id"], saved_todo["size"])
+    try:
+        assert widget.widget_id == saved_todo["id"]
+        assert widget.todos == saved_todo["todos"]
+        assert widget.list_widget.count() == 2
+        assert widget.list_widget.item(0).text() == "○ 写周报"
+        assert widget.list_widget.item(1).text() == "✓ 买牛奶"
+    finally:
+        widget.close()